@@ -0,0 +1,4 @@
+"""Pytest configuration for the top-level visualize_reviews tests."""
+
+# The docs site is a Node project; nothing under it is a Python test
+collect_ignore = ["docs-site"]
@@ -0,0 +1,45 @@
+"""Numba-compiled score kernel used for large teams.
+
+Importing this module requires numba; score_calculator imports it only for
+teams of NUMBA_MIN_MEMBERS or more and otherwise uses its NumPy path.
+"""
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def score_kernel(values, weights):
+    """Normalize and weight a members x components metrics matrix.
+    
+    Mirrors the NumPy path in score_calculator operation for operation
+    (no fastmath) so both produce identical floats.
+    
+    Args:
+        values: float64 array of shape (members, components)
+        weights: float64 array of shape (components,)
+        
+    Returns:
+        Tuple of (normalized, weighted, totals) float64 arrays
+    """
+    n, m = values.shape
+    normalized = np.zeros((n, m))
+    weighted = np.zeros((n, m))
+    totals = np.zeros(n)
+    
+    for j in range(m):
+        max_value = values[0, j]
+        for i in range(1, n):
+            if values[i, j] > max_value:
+                max_value = values[i, j]
+        if max_value > 0:
+            for i in range(n):
+                normalized[i, j] = values[i, j] / max_value * 100
+                weighted[i, j] = normalized[i, j] * weights[j]
+    
+    for i in range(n):
+        total = weighted[i, 0]
+        for j in range(1, m):
+            total += weighted[i, j]
+        totals[i] = total
+    
+    return normalized, weighted, totals
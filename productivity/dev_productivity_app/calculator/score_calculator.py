@@ -1,10 +1,163 @@
 """Score calculator for team productivity metrics."""
-from typing import Dict, Any, List
+import importlib.util
+from functools import lru_cache
+from typing import Dict, Any, List, Tuple, Union
+
+import numpy as np
+
+# Metric keys in score-matrix column order
+METRIC_KEYS = ("items_completed", "prs_authored", "code_reviews")
+
+# Score arrays stay float64: scores are handed out as Python floats and must
+# match plain float arithmetic exactly (float32 turns 100 * 0.3 into 30.000002)
+SCORE_DTYPE = np.float64
+
+# Score columns carried by rank_scores(..., as_records=True)
+RANK_RECORD_FIELDS = ("total", "items_weighted", "prs_weighted", "reviews_weighted")
+
+# Score changes within +/- TREND_THRESHOLD count as stable
+TREND_THRESHOLD = 0.5
+TREND_LABELS = np.array(["down", "stable", "up"])
+
+# Team label for members missing from summarize_by_team's team_map
+UNASSIGNED_TEAM = "Unassigned"
+
+# numba is only needed for very large teams, so it is looked up here but
+# imported on first use; plain imports skip its import and JIT cache load
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+# Below this team size the NumPy path beats the compiled kernel's call overhead
+NUMBA_MIN_MEMBERS = 256
+
+try:
+    import numpy_groupies as npg
+    NUMPY_GROUPIES_AVAILABLE = True
+except ImportError:
+    NUMPY_GROUPIES_AVAILABLE = False
+
+
+@lru_cache(maxsize=8)
+def _weight_vector(weight_items: Tuple[Tuple[str, float], ...]) -> Tuple[float, float, float]:
+    """Resolve (items, prs, reviews) weights from config weight items.
+    
+    Weights are normalized if they don't sum to 1 and defaults fill in missing
+    components. Cached because every scoring call passes the same weights.
+    
+    Args:
+        weight_items: tuple(weights.items()), in config order
+        
+    Returns:
+        Tuple of (items_weight, prs_weight, reviews_weight)
+    """
+    weights = dict(weight_items)
+    
+    # Normalize weights if they don't sum to 1
+    weight_sum = sum(weights.values())
+    if weight_sum > 0 and abs(weight_sum - 1.0) > 0.01:
+        weights = {k: v / weight_sum for k, v in weights.items()}
+    
+    return (
+        weights.get("items_completed", 0.5),
+        weights.get("prs_authored", 0.3),
+        weights.get("code_reviews", 0.2)
+    )
+
+
+def _score_matrix(values: np.ndarray, weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Normalize and weight a members x components metrics matrix.
+    
+    Each component is scaled to 0-100 against the team max; a component whose
+    max is not positive scores 0 for everyone. Teams of NUMBA_MIN_MEMBERS or
+    more use the compiled kernel when numba is installed.
+    
+    Args:
+        values: float64 array of shape (members, components)
+        weights: float64 array of shape (components,)
+        
+    Returns:
+        Tuple of (normalized, weighted, totals) float64 arrays
+    """
+    if NUMBA_AVAILABLE and len(values) >= NUMBA_MIN_MEMBERS:
+        from ._score_numba import score_kernel
+        return score_kernel(values, weights)
+    
+    max_values = values.max(axis=0, keepdims=True)
+    has_max = max_values > 0
+    normalized = np.divide(
+        values, np.where(has_max, max_values, 1.0)
+    ) * 100
+    normalized = np.where(has_max, normalized, 0.0)
+    
+    weighted = normalized * weights
+    return normalized, weighted, weighted.sum(axis=1)
+
+
+def _score_members(
+    metrics: Dict[str, Dict[str, Any]],
+    config: Dict[str, Any]
+) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+    """Score every member of a non-empty metrics mapping.
+    
+    Args:
+        metrics: Raw metrics per team member
+        config: Configuration with weights
+        
+    Returns:
+        Tuple of (names, normalized, weighted, totals), arrays in names order
+    """
+    weights = np.array(
+        _weight_vector(tuple(config.get("weights", {}).items())),
+        dtype=SCORE_DTYPE
+    )
+    
+    names = list(metrics)
+    # Filled straight into a preallocated buffer; missing metrics read as 0
+    values = np.fromiter(
+        (m.get(key, 0) for m in metrics.values() for key in METRIC_KEYS),
+        dtype=SCORE_DTYPE,
+        count=len(names) * len(METRIC_KEYS)
+    ).reshape(len(names), len(METRIC_KEYS))
+    
+    return (names, *_score_matrix(values, weights))
+
+
+def _score_record(score_row: List[float], weighted_row: List[float], total: float) -> Dict[str, float]:
+    """Per-member score dict from one row of the score matrices."""
+    return {
+        "items_score": score_row[0],
+        "prs_score": score_row[1],
+        "reviews_score": score_row[2],
+        "items_weighted": weighted_row[0],
+        "prs_weighted": weighted_row[1],
+        "reviews_weighted": weighted_row[2],
+        "total": total
+    }
+
+
+def _rank_order(totals: np.ndarray) -> Tuple[List[int], List[int]]:
+    """Descending order of totals and the rank at each position.
+    
+    The sort is stable so tied members keep their input order, and tied
+    members share the rank of the first of them (1, 1, 3, ...).
+    
+    Args:
+        totals: float64 array of member totals
+        
+    Returns:
+        Tuple of (member indices best first, rank per position)
+    """
+    order = np.argsort(-totals, kind="stable")
+    sorted_neg = -totals[order]
+    ranks = np.searchsorted(sorted_neg, sorted_neg, side="left") + 1
+    return order.tolist(), ranks.tolist()
 
 
 def calculate_scores(raw_data: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
     """Calculate productivity scores for all team members.
     
+    Metrics are laid out as a members x components float64 matrix so the
+    normalization and weighting run as whole-array operations.
+    
     Args:
         raw_data: Raw metrics data with structure:
             {"metrics": {"Name": {"items_completed": N, "prs_authored": N, "code_reviews": N}}}
@@ -22,68 +175,52 @@ def calculate_scores(raw_data: Dict[str, Any], config: Dict[str, Any]) -> Dict[s
     if not metrics:
         return {}
     
-    weights = config.get("weights", {})
+    names, normalized, weighted, totals = _score_members(metrics, config)
     
-    # Normalize weights if they don't sum to 1
-    weight_sum = sum(weights.values())
-    if weight_sum > 0 and abs(weight_sum - 1.0) > 0.01:
-        weights = {k: v / weight_sum for k, v in weights.items()}
+    return {
+        name: _score_record(score_row, weighted_row, total)
+        for name, score_row, weighted_row, total in zip(
+            names, normalized.tolist(), weighted.tolist(), totals.tolist()
+        )
+    }
+
+
+def _rank_records(scores: Dict[str, Any], ranked_names: List[str], ranks: List[int]) -> np.recarray:
+    """Ranked members as a record array, filled one column at a time.
     
-    # Find max values for normalization
-    max_items = max(
-        (m.get("items_completed", 0) for m in metrics.values()),
-        default=0
-    )
-    max_prs = max(
-        (m.get("prs_authored", 0) for m in metrics.values()),
-        default=0
-    )
-    max_reviews = max(
-        (m.get("code_reviews", 0) for m in metrics.values()),
-        default=0
+    Args:
+        scores: Dictionary of scores per team member
+        ranked_names: Member names, best first
+        ranks: Rank for each entry of ranked_names
+        
+    Returns:
+        Record array with rank, name and RANK_RECORD_FIELDS fields
+    """
+    name_w = max(map(len, ranked_names), default=1)
+    dtype = np.dtype(
+        [("rank", "<i4"), ("name", f"<U{name_w}")]
+        + [(field, SCORE_DTYPE) for field in RANK_RECORD_FIELDS]
     )
     
-    scores = {}
+    records = np.empty(len(ranked_names), dtype=dtype)
+    records["rank"] = ranks
+    records["name"] = ranked_names
+    for field in RANK_RECORD_FIELDS:
+        records[field] = [scores[name].get(field, 0) for name in ranked_names]
     
-    for name, data in metrics.items():
-        items = data.get("items_completed", 0)
-        prs = data.get("prs_authored", 0)
-        reviews = data.get("code_reviews", 0)
-        
-        # Normalize to 0-100 scale
-        items_score = (items / max_items * 100) if max_items > 0 else 0.0
-        prs_score = (prs / max_prs * 100) if max_prs > 0 else 0.0
-        reviews_score = (reviews / max_reviews * 100) if max_reviews > 0 else 0.0
-        
-        # Apply weights
-        items_weight = weights.get("items_completed", 0.5)
-        prs_weight = weights.get("prs_authored", 0.3)
-        reviews_weight = weights.get("code_reviews", 0.2)
-        
-        items_weighted = items_score * items_weight
-        prs_weighted = prs_score * prs_weight
-        reviews_weighted = reviews_score * reviews_weight
-        
-        total = items_weighted + prs_weighted + reviews_weighted
-        
-        scores[name] = {
-            "items_score": items_score,
-            "prs_score": prs_score,
-            "reviews_score": reviews_score,
-            "items_weighted": items_weighted,
-            "prs_weighted": prs_weighted,
-            "reviews_weighted": reviews_weighted,
-            "total": total
-        }
-    
-    return scores
+    return records.view(np.recarray)
 
 
-def rank_scores(scores: Dict[str, Any]) -> List[Dict[str, Any]]:
+def rank_scores(
+    scores: Dict[str, Any],
+    as_records: bool = False
+) -> Union[List[Dict[str, Any]], np.recarray]:
     """Rank team members by total score.
     
     Args:
         scores: Dictionary of scores per team member
+        as_records: If True, return a NumPy record array with the rank, name
+            and RANK_RECORD_FIELDS columns instead of a list of dicts
         
     Returns:
         List of ranked members with structure:
@@ -91,34 +228,87 @@ def rank_scores(scores: Dict[str, Any]) -> List[Dict[str, Any]]:
         
         Ties are handled by assigning the same rank.
     """
-    if not scores:
+    if not scores and not as_records:
         return []
     
-    # Sort by total score descending
-    sorted_members = sorted(
-        scores.items(),
-        key=lambda x: x[1]["total"],
-        reverse=True
+    names = list(scores)
+    totals = np.fromiter(
+        (s["total"] for s in scores.values()),
+        dtype=SCORE_DTYPE,
+        count=len(names)
     )
     
-    ranked = []
-    current_rank = 1
-    prev_total = None
+    order, ranks = _rank_order(totals)
     
-    for i, (name, score_data) in enumerate(sorted_members):
-        # Handle ties - same score gets same rank
-        if prev_total is not None and score_data["total"] < prev_total:
-            current_rank = i + 1
+    if as_records:
+        return _rank_records(scores, [names[i] for i in order], ranks)
+    
+    return [
+        {"rank": rank, "name": names[i], **scores[names[i]]}
+        for i, rank in zip(order, ranks)
+    ]
+
+
+def calculate_and_rank(raw_data: Dict[str, Any], config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Calculate scores and rank team members in one pass.
+    
+    Equivalent to rank_scores(calculate_scores(raw_data, config)) without
+    building the intermediate per-member scores dictionary.
+    
+    Args:
+        raw_data: Raw metrics data (see calculate_scores)
+        config: Configuration with weights
         
-        ranked.append({
-            "rank": current_rank,
-            "name": name,
-            **score_data
-        })
+    Returns:
+        List of ranked members (see rank_scores)
+    """
+    metrics = raw_data.get("metrics", {})
+    
+    if not metrics:
+        return []
+    
+    names, normalized, weighted, totals = _score_members(metrics, config)
+    order, ranks = _rank_order(totals)
+    
+    score_rows = normalized.tolist()
+    weighted_rows = weighted.tolist()
+    total_values = totals.tolist()
+    
+    return [
+        {
+            "rank": rank,
+            "name": names[i],
+            **_score_record(score_rows[i], weighted_rows[i], total_values[i])
+        }
+        for i, rank in zip(order, ranks)
+    ]
+
+
+@lru_cache(maxsize=128)
+def _contribution_rows(
+    weighted_rows: Tuple[Tuple[float, float, float, float], ...]
+) -> Tuple[Tuple[float, float, float], ...]:
+    """Percentage split of each (items, prs, reviews, total) row.
+    
+    Cached because reports and tests ask for the same scores repeatedly.
+    
+    Args:
+        weighted_rows: Per-member (items_weighted, prs_weighted,
+            reviews_weighted, total) tuples
         
-        prev_total = score_data["total"]
+    Returns:
+        Per-member (items_pct, prs_pct, reviews_pct) tuples
+    """
+    matrix = np.array(weighted_rows, dtype=SCORE_DTYPE).reshape(len(weighted_rows), 4)
+    totals = matrix[:, 3:]
     
-    return ranked
+    # Members with a non-positive total contribute 0% everywhere
+    pct = np.divide(
+        matrix[:, :3], totals,
+        out=np.zeros((len(weighted_rows), 3), dtype=SCORE_DTYPE),
+        where=totals > 0
+    ) * 100
+    return tuple(map(tuple, pct.tolist()))
 
 
 def calculate_component_contributions(scores: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
@@ -131,25 +321,49 @@ def calculate_component_contributions(scores: Dict[str, Any]) -> Dict[str, Dict[
         Dictionary with component contributions as percentages:
             {"Alice": {"items_pct": 50.0, "prs_pct": 30.0, "reviews_pct": 20.0}}
     """
-    contributions = {}
+    if not scores:
+        return {}
     
-    for name, data in scores.items():
-        total = data.get("total", 0)
-        
-        if total > 0:
-            items_pct = (data.get("items_weighted", 0) / total) * 100
-            prs_pct = (data.get("prs_weighted", 0) / total) * 100
-            reviews_pct = (data.get("reviews_weighted", 0) / total) * 100
-        else:
-            items_pct = prs_pct = reviews_pct = 0.0
-        
-        contributions[name] = {
-            "items_pct": items_pct,
-            "prs_pct": prs_pct,
-            "reviews_pct": reviews_pct
-        }
+    rows = _contribution_rows(tuple(
+        (
+            data.get("items_weighted", 0),
+            data.get("prs_weighted", 0),
+            data.get("reviews_weighted", 0),
+            data.get("total", 0)
+        )
+        for data in scores.values()
+    ))
     
-    return contributions
+    return {
+        name: {"items_pct": items_pct, "prs_pct": prs_pct, "reviews_pct": reviews_pct}
+        for name, (items_pct, prs_pct, reviews_pct) in zip(scores, rows)
+    }
+
+
+@lru_cache(maxsize=64)
+def _compare_arrays(current_bytes: bytes, previous_bytes: bytes) -> Tuple[tuple, tuple]:
+    """Per-member change and trend for two float64 total arrays.
+    
+    Keyed on the raw array bytes so large period comparisons hash in C.
+    
+    Args:
+        current_bytes: float64 current-period totals, as ndarray.tobytes()
+        previous_bytes: float64 previous-period totals, as ndarray.tobytes()
+        
+    Returns:
+        Tuple of (changes, trends), one entry per member
+    """
+    change = (
+        np.frombuffer(current_bytes, dtype=SCORE_DTYPE)
+        - np.frombuffer(previous_bytes, dtype=SCORE_DTYPE)
+    )
+    # Branchless three-way split: -1/0/+1 shifted to an index into TREND_LABELS
+    trend_idx = (
+        (change > TREND_THRESHOLD).view(np.int8)
+        - (change < -TREND_THRESHOLD).view(np.int8)
+        + 1
+    )
+    return tuple(change.tolist()), tuple(TREND_LABELS[trend_idx].tolist())
 
 
 def compare_periods(current_scores: Dict[str, Any], previous_scores: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
@@ -160,30 +374,73 @@ def compare_periods(current_scores: Dict[str, Any], previous_scores: Dict[str, A
         previous_scores: Scores from previous period
         
     Returns:
-        Dictionary with trend data:
+        Dictionary with trend data, current members first and then members
+        who only appear in the previous period:
             {"Alice": {"current": 85.0, "previous": 80.0, "change": 5.0, "trend": "up"}}
     """
-    comparison = {}
+    names = list(current_scores)
+    names.extend(name for name in previous_scores if name not in current_scores)
     
-    all_names = set(current_scores.keys()) | set(previous_scores.keys())
+    current = [current_scores.get(name, {}).get("total", 0) for name in names]
+    previous = [previous_scores.get(name, {}).get("total", 0) for name in names]
     
-    for name in all_names:
-        current = current_scores.get(name, {}).get("total", 0)
-        previous = previous_scores.get(name, {}).get("total", 0)
-        change = current - previous
-        
-        if change > 0.5:
-            trend = "up"
-        elif change < -0.5:
-            trend = "down"
-        else:
-            trend = "stable"
-        
-        comparison[name] = {
-            "current": current,
-            "previous": previous,
-            "change": change,
-            "trend": trend
+    change, trend = _compare_arrays(
+        np.fromiter(current, dtype=SCORE_DTYPE, count=len(names)).tobytes(),
+        np.fromiter(previous, dtype=SCORE_DTYPE, count=len(names)).tobytes()
+    )
+    
+    return {
+        name: {
+            "current": cur,
+            "previous": prev,
+            "change": delta,
+            "trend": direction
         }
+        for name, cur, prev, delta, direction in zip(
+            names, current, previous, change, trend
+        )
+    }
+
+
+def summarize_by_team(
+    scores: Dict[str, Any],
+    team_map: Dict[str, str]
+) -> Dict[str, Dict[str, Any]]:
+    """Aggregate member totals per team (or squad).
+    
+    Uses numpy_groupies when installed, otherwise np.bincount over the same
+    integer group index.
+    
+    Args:
+        scores: Dictionary of scores per team member
+        team_map: Team label per member name; members not listed are
+            grouped under UNASSIGNED_TEAM
+        
+    Returns:
+        Dictionary per team, sorted by team label:
+            {"Platform": {"members": 2, "total": 150.0, "average": 75.0}}
+    """
+    if not scores:
+        return {}
+    
+    teams, group_idx = np.unique(
+        [team_map.get(name, UNASSIGNED_TEAM) for name in scores],
+        return_inverse=True
+    )
+    group_idx = group_idx.ravel()
+    totals = np.fromiter(
+        (s.get("total", 0) for s in scores.values()),
+        dtype=SCORE_DTYPE,
+        count=len(scores)
+    )
+    
+    counts = np.bincount(group_idx, minlength=len(teams))
+    if NUMPY_GROUPIES_AVAILABLE:
+        sums = npg.aggregate(group_idx, totals, func="sum", size=len(teams))
+    else:
+        sums = np.bincount(group_idx, weights=totals, minlength=len(teams))
     
-    return comparison
+    return {
+        team: {"members": count, "total": total, "average": total / count}
+        for team, count, total in zip(teams.tolist(), counts.tolist(), sums.tolist())
+    }
@@ -1,100 +1,161 @@
 """Table generation for terminal and markdown output."""
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from io import StringIO
+from operator import itemgetter
+from typing import Dict, Any, Callable, List, Optional, Tuple
 
+# (header, row key) for the score columns of the ranking table, in order
+SCORE_COLUMNS = (
+    ("Items", "items_weighted"),
+    ("PRs", "prs_weighted"),
+    ("Reviews", "reviews_weighted"),
+    ("Total", "total"),
+)
 
-def create_ranking_table(
-    ranked_data: List[Dict[str, Any]],
-    precision: int = 1
-) -> str:
-    """Create a text table showing rankings.
+# Pulls (rank, name, *score columns) out of a ranked row in one C-level call
+_ROW_VALUES = itemgetter("rank", "name", *(key for _, key in SCORE_COLUMNS))
+
+
+def _row_values(ranked_data: List[Dict[str, Any]]) -> List[tuple]:
+    """Extract (rank, name, items, prs, reviews, total) for every row.
+    
+    Rows missing a score column fall back to per-key lookups that read it as 0.
     
     Args:
         ranked_data: List of ranked team members
-        precision: Decimal precision for numbers
         
     Returns:
-        Formatted table string
+        List of value tuples in SCORE_COLUMNS order after rank and name
     """
-    if not ranked_data:
-        return ""
+    try:
+        return list(map(_ROW_VALUES, ranked_data))
+    except KeyError:
+        return [
+            (d["rank"], d["name"], *(d.get(key, 0) for _, key in SCORE_COLUMNS))
+            for d in ranked_data
+        ]
+
+
+@lru_cache(maxsize=16)
+def _ranking_layout(name_w: int, precision: int) -> Tuple[str, str, Callable[..., str]]:
+    """Header, separator and row formatter for a ranking table.
     
-    # Column widths
+    Cached because the layout only depends on the name column width and
+    precision, which rarely change between calls.
+    
+    Args:
+        name_w: Width of the name column
+        precision: Decimal precision for numbers
+        
+    Returns:
+        Tuple of (header, separator, format_row)
+    """
     rank_w = 4
-    name_w = max(len(d["name"]) for d in ranked_data) + 2
     score_w = 8
     
-    # Header
-    header = (
-        f"{'Rank':<{rank_w}} "
-        f"{'Name':<{name_w}} "
-        f"{'Items':<{score_w}} "
-        f"{'PRs':<{score_w}} "
-        f"{'Reviews':<{score_w}} "
-        f"{'Total':<{score_w}}"
+    header = f"{'Rank':<{rank_w}} {'Name':<{name_w}} " + " ".join(
+        f"{title:<{score_w}}" for title, _ in SCORE_COLUMNS
     )
     
     separator = "-" * len(header)
     
-    lines = [header, separator]
+    # Row template built once; each row is then a single str.format call
+    format_row = (
+        f"{{:<{rank_w}}} {{:<{name_w}}} "
+        + " ".join([f"{{:<{score_w}.{precision}f}}"] * len(SCORE_COLUMNS))
+    ).format
+    
+    return header, separator, format_row
+
+
+def _render_key(ranked_data: List[Dict[str, Any]]) -> Tuple[tuple, ...]:
+    """Hashable form of the ranked rows for the render caches.
     
-    for d in ranked_data:
-        items = d.get("items_weighted", 0)
-        prs = d.get("prs_weighted", 0)
-        reviews = d.get("reviews_weighted", 0)
-        total = d.get("total", 0)
+    Ranks become strings and scores floats (adding 0.0 also folds -0.0 into
+    0.0), so rows that compare equal always render to the same text.
+    
+    Args:
+        ranked_data: List of ranked team members
         
-        line = (
-            f"{d['rank']:<{rank_w}} "
-            f"{d['name']:<{name_w}} "
-            f"{items:<{score_w}.{precision}f} "
-            f"{prs:<{score_w}.{precision}f} "
-            f"{reviews:<{score_w}.{precision}f} "
-            f"{total:<{score_w}.{precision}f}"
-        )
-        lines.append(line)
+    Returns:
+        Tuple of (rank, name, items, prs, reviews, total) tuples
+    """
+    return tuple(
+        (str(rank), name, *(value + 0.0 for value in scores))
+        for rank, name, *scores in _row_values(ranked_data)
+    )
+
+
+@lru_cache(maxsize=32)
+def _render_ranking_table(rows: Tuple[tuple, ...], precision: int) -> str:
+    """Render _render_key rows as a text table; cached per rows and precision."""
+    name_w = max(len(row[1]) for row in rows) + 2
+    header, separator, format_row = _ranking_layout(name_w, precision)
+    
+    lines = [header, separator]
+    lines.extend(format_row(*row) for row in rows)
     
     return "\n".join(lines)
 
 
-def create_markdown_table(
+def create_ranking_table(
     ranked_data: List[Dict[str, Any]],
     precision: int = 1
 ) -> str:
-    """Create a markdown format table.
+    """Create a text table showing rankings.
     
     Args:
         ranked_data: List of ranked team members
         precision: Decimal precision for numbers
         
     Returns:
-        Markdown table string
+        Formatted table string
     """
     if not ranked_data:
         return ""
     
+    return _render_ranking_table(_render_key(ranked_data), precision)
+
+
+@lru_cache(maxsize=32)
+def _render_markdown_table(rows: Tuple[tuple, ...], precision: int) -> str:
+    """Render _render_key rows as a markdown table; cached per rows and precision."""
     # Header
     header = "| Rank | Name | Items (50%) | PRs (30%) | Reviews (20%) | **Total** |"
     separator = "|:----:|------|:-----------:|:---------:|:-------------:|:---------:|"
     
-    lines = [header, separator]
+    format_row = (
+        "\n| {} | {} "
+        + f"| {{:.{precision}f}} | {{:.{precision}f}} | {{:.{precision}f}} "
+        + f"| **{{:.{precision}f}}** |"
+    ).format
     
-    for d in ranked_data:
-        items = d.get("items_weighted", 0)
-        prs = d.get("prs_weighted", 0)
-        reviews = d.get("reviews_weighted", 0)
-        total = d.get("total", 0)
+    buf = StringIO()
+    buf.write(header)
+    buf.write("\n")
+    buf.write(separator)
+    buf.writelines(format_row(*row) for row in rows)
+    
+    return buf.getvalue()
+
+
+def create_markdown_table(
+    ranked_data: List[Dict[str, Any]],
+    precision: int = 1
+) -> str:
+    """Create a markdown format table.
+    
+    Args:
+        ranked_data: List of ranked team members
+        precision: Decimal precision for numbers
         
-        line = (
-            f"| {d['rank']} "
-            f"| {d['name']} "
-            f"| {items:.{precision}f} "
-            f"| {prs:.{precision}f} "
-            f"| {reviews:.{precision}f} "
-            f"| **{total:.{precision}f}** |"
-        )
-        lines.append(line)
+    Returns:
+        Markdown table string
+    """
+    if not ranked_data:
+        return ""
     
-    return "\n".join(lines)
+    return _render_markdown_table(_render_key(ranked_data), precision)
 
 
 def print_ranking_table(
@@ -33,7 +33,7 @@ from fetchers.base_fetcher import (
     load_config, load_team_members
 )
 from fetchers.github_fetcher import GitHubFetcher
-from calculator.score_calculator import calculate_scores, rank_scores
+from calculator.score_calculator import calculate_and_rank
 from display.tables import print_ranking_table, create_markdown_table
 
 
@@ -153,8 +153,7 @@ def main():
     
     # Calculate scores
     print("\n=== Calculating scores ===")
-    scores = calculate_scores(raw_data, config)
-    ranked = rank_scores(scores)
+    ranked = calculate_and_rank(raw_data, config)
     
     # Display
     print("\n=== Results ===")
@@ -4,6 +4,7 @@ import subprocess
 import hashlib
 import os
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Tuple, Dict, Any
 
@@ -50,6 +51,20 @@ def load_env_yaml() -> Dict[str, Any]:
         return {}
 
 
+@lru_cache(maxsize=256)
+def _test_metrics_for(jira_account_id: str) -> Tuple[int, int]:
+    """Deterministic (items, story_points) for a Jira account ID.
+    
+    Cached because test mode asks for the same members repeatedly; returns a
+    tuple so callers always build their own (mutable) MetricData.
+    """
+    hash_val = int(hashlib.md5(jira_account_id.encode()).hexdigest(), 16)
+    
+    items = (hash_val % 40) + 10  # 10-49 items
+    points = (hash_val % 30) + 5  # 5-34 story points
+    return items, points
+
+
 class JiraFetcher(BaseFetcher):
     """Fetches Jira metrics: items completed and story points."""
     
@@ -113,10 +128,7 @@ class JiraFetcher(BaseFetcher):
             MetricData with deterministic test values
         """
         # Generate deterministic values based on account ID hash
-        hash_val = int(hashlib.md5(member.jira_account_id.encode()).hexdigest(), 16)
-        
-        items = (hash_val % 40) + 10  # 10-49 items
-        points = (hash_val % 30) + 5  # 5-34 story points
+        items, points = _test_metrics_for(member.jira_account_id)
         
         return MetricData(
             items_completed=items,
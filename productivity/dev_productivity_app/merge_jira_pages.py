@@ -4,36 +4,50 @@
 import json
 import sys
 from pathlib import Path
+from typing import Iterable, Optional, TextIO
 
 
-def merge_jira_pages(data_dir: str, output_file: str):
-    """Merge all jira_year_page*.json files into one."""
+def merge_jira_pages(
+    data_dir: str,
+    output_file: str,
+    page_files: Optional[Iterable[Path]] = None,
+    file: Optional[TextIO] = None
+):
+    """Merge all jira_year_page*.json files into one.
+    
+    If page_files is given, those files are merged in the given order and
+    data_dir is not globbed. Progress is printed to file (default stdout).
+    """
+    out = file if file is not None else sys.stdout
     data_path = Path(data_dir)
     
     all_issues = []
     
     # Find all page files
-    page_files = sorted(data_path.glob("jira_year_page*.json"))
+    if page_files is None:
+        page_files = sorted(data_path.glob("jira_year_page*.json"))
+    else:
+        page_files = [Path(f) for f in page_files]
     
-    print(f"Found {len(page_files)} page files")
+    print(f"Found {len(page_files)} page files", file=out)
     
     for page_file in page_files:
-        print(f"  Processing {page_file.name}...")
+        print(f"  Processing {page_file.name}...", file=out)
         with open(page_file, "r") as f:
             data = json.load(f)
             issues = data.get("issues", [])
             all_issues.extend(issues)
-            print(f"    Added {len(issues)} issues (total: {len(all_issues)})")
+            print(f"    Added {len(issues)} issues (total: {len(all_issues)})", file=out)
     
     # Also check for jira_raw.json (sprint data)
     raw_file = data_path / "jira_raw.json"
     if raw_file.exists():
-        print(f"  Processing {raw_file.name}...")
+        print(f"  Processing {raw_file.name}...", file=out)
         with open(raw_file, "r") as f:
             data = json.load(f)
             # Don't add if already merged from year pages
             # Just note it
-            print(f"    (Sprint data available: {len(data.get('issues', []))} issues)")
+            print(f"    (Sprint data available: {len(data.get('issues', []))} issues)", file=out)
     
     # Create merged output
     merged = {
@@ -46,7 +60,7 @@ def merge_jira_pages(data_dir: str, output_file: str):
     with open(output_path, "w") as f:
         json.dump(merged, f, indent=2)
     
-    print(f"\nMerged {len(all_issues)} issues to {output_path}")
+    print(f"\nMerged {len(all_issues)} issues to {output_path}", file=out)
     
     # Print breakdown by assignee
     by_assignee = {}
@@ -56,9 +70,9 @@ def merge_jira_pages(data_dir: str, output_file: str):
             name = assignee.get("displayName", "Unknown")
             by_assignee[name] = by_assignee.get(name, 0) + 1
     
-    print("\nBreakdown by assignee:")
+    print("\nBreakdown by assignee:", file=out)
     for name, count in sorted(by_assignee.items(), key=lambda x: -x[1]):
-        print(f"  {name}: {count}")
+        print(f"  {name}: {count}", file=out)
 
 
 if __name__ == "__main__":
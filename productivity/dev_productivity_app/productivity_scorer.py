@@ -10,11 +10,19 @@ Usage:
 """
 import argparse
 import json
+import os
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -24,11 +32,35 @@ from fetchers.base_fetcher import (
 )
 from fetchers.github_fetcher import GitHubFetcher
 from fetchers.jira_fetcher import JiraFetcher
-from calculator.score_calculator import calculate_scores, rank_scores
+from calculator.score_calculator import calculate_scores, rank_scores, calculate_and_rank
 from display.charts import create_bar_chart, create_ranking_chart
 from display.tables import create_ranking_table, create_markdown_table, print_ranking_table
 
 
+@lru_cache(maxsize=16)
+def _load_json_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a JSON file; cache key includes mtime and size so edits invalidate it."""
+    data = Path(path).read_bytes()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json_file(path: str) -> Any:
+    """Load a JSON data file, reusing the parsed result while it is unchanged.
+    
+    The returned object may be shared between calls and must not be mutated.
+    
+    Args:
+        path: Path to the JSON file
+        
+    Returns:
+        Parsed JSON content
+    """
+    stat = os.stat(path)
+    return _load_json_cached(str(path), stat.st_mtime_ns, stat.st_size)
+
+
 def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     """Parse command line arguments.
     
@@ -336,9 +368,13 @@ def generate_markdown_report(
     print(f"\nSaved report to {output_path}")
 
 
-def main():
-    """Main entry point."""
-    args = parse_args()
+def main(argv: Optional[List[str]] = None):
+    """Main entry point.
+    
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
+    """
+    args = parse_args(argv)
     
     if args.command is None:
         print("Error: No command specified. Use --help for usage.")
@@ -352,15 +388,11 @@ def main():
                      output_dir=Path(args.output).parent if args.output else None)
         
         elif args.command == "score":
-            with open(args.data, "r") as f:
-                raw_data = json.load(f)
-            scores = run_score(raw_data, config)
-            ranked = rank_scores(scores)
-            print_ranking_table(ranked)
+            raw_data = load_json_file(args.data)
+            print_ranking_table(calculate_and_rank(raw_data, config))
         
         elif args.command == "display":
-            with open(args.data, "r") as f:
-                scores = json.load(f)
+            scores = load_json_file(args.data)
             run_display(scores, args.type, args.output)
         
         elif args.command == "run":
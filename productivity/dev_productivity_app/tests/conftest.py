@@ -0,0 +1,248 @@
+"""Shared pytest fixtures for the productivity scorer tests."""
+import copy
+import json
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Make the app's top-level packages importable from every test module, once
+_APP_DIR = str(Path(__file__).parent.parent)
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
+
+# Non-interactive backend for every test session; productivity_scorer imports
+# pyplot through display.charts, so chart code is always loaded anyway
+import matplotlib
+matplotlib.use("Agg")
+
+from calculator.score_calculator import calculate_scores, rank_scores
+from fetchers.base_fetcher import TeamMember, Period, load_config
+from fetchers.github_fetcher import GitHubFetcher
+from fetchers.jira_fetcher import JiraFetcher
+from merge_jira_pages import merge_jira_pages
+
+
+def pytest_addoption(parser):
+    """Add the --run-perf flag for the heavy chart-rendering tests."""
+    parser.addoption(
+        "--run-perf", action="store_true", default=False,
+        help="Run tests marked perf (matplotlib chart rendering)"
+    )
+
+
+def pytest_configure(config):
+    """Register custom markers."""
+    config.addinivalue_line("markers", "slow: test takes noticeably longer than a unit test")
+    config.addinivalue_line("markers", "integration: test exercises several components together")
+    config.addinivalue_line("markers", "perf: heavy test, skipped unless --run-perf is given")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip perf-marked tests unless --run-perf was passed."""
+    if config.getoption("--run-perf"):
+        return
+    skip_perf = pytest.mark.skip(reason="needs --run-perf")
+    for item in items:
+        if "perf" in item.keywords:
+            item.add_marker(skip_perf)
+
+
+@pytest.fixture(scope="session")
+def alice_member():
+    """Team member used across fetcher and pipeline tests."""
+    return TeamMember("Alice", "alice-dev", "test-123")
+
+
+@pytest.fixture(scope="session")
+def bob_member():
+    """Second team member for multi-member tests."""
+    return TeamMember("Bob", "bob-eng", "test-456")
+
+
+@pytest.fixture(scope="session")
+def sprint_period():
+    """Standard three-week sprint period."""
+    return Period("sprint", date(2026, 1, 1), date(2026, 1, 21))
+
+
+@pytest.fixture(scope="session")
+def ps():
+    """The productivity_scorer module, imported once on first use."""
+    import productivity_scorer
+    return productivity_scorer
+
+
+@pytest.fixture(scope="session")
+def jira_fetcher():
+    """Jira fetcher with default statuses, for parsing and JQL tests."""
+    return JiraFetcher(project="P81")
+
+
+@pytest.fixture(scope="session")
+def jira_fetcher_test():
+    """Jira fetcher in test mode (no API calls)."""
+    return JiraFetcher(project="P81", test_mode=True)
+
+
+@pytest.fixture(scope="session")
+def github_fetcher_test():
+    """GitHub fetcher in test mode (no gh calls)."""
+    return GitHubFetcher(test_mode=True)
+
+
+# Two-member pipeline configuration; fixtures only ever hand out copies
+_BASE_CONFIG = {
+    "version": "1.0",
+    "team": {
+        "name": "Test Team",
+        "members": [
+            {"name": "Alice", "github_username": "alice", "jira_account_id": "123"},
+            {"name": "Bob", "github_username": "bob", "jira_account_id": "456"}
+        ]
+    },
+    "weights": {"items_completed": 0.50, "prs_authored": 0.30, "code_reviews": 0.20},
+    "periods": {"sprint": {"type": "fixed", "start": "2026-01-01", "end": "2026-01-21"}},
+    "jira": {"project": "TEST", "done_statuses": ["Done"]}
+}
+
+
+@pytest.fixture
+def base_config():
+    """Fresh deep copy of the two-member pipeline configuration."""
+    return copy.deepcopy(_BASE_CONFIG)
+
+
+@pytest.fixture(scope="session")
+def base_config_json():
+    """The two-member pipeline configuration serialized as JSON text."""
+    return json.dumps(_BASE_CONFIG)
+
+
+@pytest.fixture(scope="session")
+def two_member_metrics():
+    """Raw data in fetcher output format for Alice and Bob."""
+    return {
+        "generated_at": "2026-01-21T12:00:00Z",
+        "period": {"name": "sprint", "start": "2026-01-01", "end": "2026-01-21"},
+        "metrics": {
+            "Alice": {"items_completed": 50, "story_points": 25, "prs_authored": 20, "code_reviews": 30},
+            "Bob": {"items_completed": 30, "story_points": 15, "prs_authored": 40, "code_reviews": 20}
+        }
+    }
+
+
+@pytest.fixture(scope="session")
+def standard_weights_config():
+    """Config holding only the default 50/30/20 weights."""
+    return {"weights": {"items_completed": 0.5, "prs_authored": 0.3, "code_reviews": 0.2}}
+
+
+@pytest.fixture(scope="module")
+def scores_two_member(two_member_metrics, standard_weights_config):
+    """calculate_scores output for two_member_metrics, computed once per module."""
+    return calculate_scores(two_member_metrics, standard_weights_config)
+
+
+@pytest.fixture(scope="module")
+def ranked_two_member(scores_two_member):
+    """rank_scores output for scores_two_member."""
+    return rank_scores(scores_two_member)
+
+
+def _dump_json_bytes(payload):
+    """Serialize payload to UTF-8 JSON bytes, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
+
+
+@pytest.fixture(scope="session")
+def write_page():
+    """Return a helper that writes ``jira_year_page{n}.json`` into a directory."""
+    def _write_page(directory, n, payload):
+        page_file = directory / f"jira_year_page{n}.json"
+        page_file.write_bytes(_dump_json_bytes(payload))
+        return page_file
+    return _write_page
+
+
+@pytest.fixture(scope="session")
+def load_merged():
+    """Return a helper that parses ``merged.json`` from a directory."""
+    def _load_merged(directory, name="merged.json"):
+        data = (directory / name).read_bytes()
+        if ORJSON_AVAILABLE:
+            return orjson.loads(data)
+        return json.loads(data)
+    return _load_merged
+
+
+@pytest.fixture(scope="session")
+def merged_single_page_dir(tmp_path_factory, write_page):
+    """Directory holding one Jira page and its merged.json, built once.
+    
+    Read-only: tests must not add files to or modify this directory.
+    """
+    data_dir = tmp_path_factory.mktemp("merged_single_page")
+    page_file = write_page(data_dir, 1, {
+        "issues": [
+            {
+                "key": "P81-123",
+                "id": "10001",
+                "fields": {
+                    "summary": "Test issue",
+                    "status": {"name": "Done"},
+                    "assignee": {"displayName": "Alice", "accountId": "abc123"},
+                    "customfield_10016": 5  # Story points
+                }
+            },
+            {"key": "P81-2", "fields": {"summary": "Issue 2", "assignee": {"displayName": "Bob"}}}
+        ]
+    })
+    merge_jira_pages(str(data_dir), "merged.json", page_files=[page_file])
+    return data_dir
+
+
+@pytest.fixture(scope="session")
+def default_config():
+    """Parsed config/default_config.json, or None if the file is missing."""
+    config_path = Path(__file__).parent.parent / "config" / "default_config.json"
+    if not config_path.exists():
+        return None
+    return load_config(str(config_path))
+
+
+@pytest.fixture(scope="session")
+def pipeline_result(tmp_path_factory):
+    """Single test-mode pipeline run shared by the end-to-end tests.
+    
+    Returns the run_full_pipeline result plus the markdown report text under
+    ``report``. Path.write_text is intercepted so the report never hits disk.
+    """
+    from productivity_scorer import run_full_pipeline
+    
+    report_path = str(tmp_path_factory.getbasetemp() / "report.md")
+    captured = {}
+    
+    def _capture_write_text(self, data, *args, **kwargs):
+        captured[str(self)] = data
+        return len(data)
+    
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(Path, "write_text", _capture_write_text)
+        result = run_full_pipeline(
+            copy.deepcopy(_BASE_CONFIG),
+            period="sprint",
+            test_mode=True,
+            output_dir=str(tmp_path_factory.mktemp("pipe")),
+            output_file=report_path
+        )
+    return {**result, "report": captured.get(report_path)}
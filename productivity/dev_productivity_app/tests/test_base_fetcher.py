@@ -4,11 +4,6 @@ from datetime import date, datetime, timedelta
 from dataclasses import dataclass
 from typing import Any
 import json
-from pathlib import Path
-
-# Import after implementation exists
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
 class TestTeamMemberDataclass:
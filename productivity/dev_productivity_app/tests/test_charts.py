@@ -1,12 +1,8 @@
 """Tests for the charts display module."""
 import pytest
-from pathlib import Path
 from unittest.mock import patch, MagicMock
 import tempfile
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 
 class TestBarChart:
     """Tests for bar chart generation."""
@@ -47,7 +47,7 @@ github:
             # The function checks if file exists before loading
             assert isinstance(result, dict)
     
-    def test_load_env_yaml_invalid_yaml(self, tmp_path, capsys):
+    def test_load_env_yaml_invalid_yaml(self, tmp_path):
         """Test handling of invalid YAML content."""
         env_file = tmp_path / ".env.yaml"
         env_file.write_text("invalid: yaml: content: [")
@@ -85,7 +85,7 @@ jira:
         
         assert expiry_date < datetime.now()  # Token is expired
     
-    def test_load_env_yaml_with_expiration_warning(self, tmp_path, capsys, monkeypatch):
+    def test_load_env_yaml_with_expiration_warning(self, tmp_path, monkeypatch):
         """Test that load_env_yaml prints warning for expiring token."""
         from fetchers import jira_fetcher
         
@@ -228,7 +228,7 @@ class TestJiraFetcherWithEnvYaml:
             elif "JIRA_EMAIL" in os.environ:
                 del os.environ["JIRA_EMAIL"]
     
-    def test_empty_token_shows_warning(self, capsys):
+    def test_empty_token_shows_warning(self):
         """Test warning when token is empty string."""
         from fetchers.jira_fetcher import JiraFetcher
         from fetchers.base_fetcher import TeamMember, Period
@@ -1,14 +1,10 @@
 """Tests for fetch_via_mcp.py script."""
 import pytest
 import json
-from pathlib import Path
 from datetime import date
 from unittest.mock import patch, MagicMock
 import sys
 
-# Add parent to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from fetch_via_mcp import parse_mcp_jira_response, main
 
 
@@ -1,92 +1,60 @@
 """Integration tests for the productivity scorer end-to-end workflow."""
+import copy
 import pytest
 import json
-from pathlib import Path
-from datetime import date
-
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 
+from display.tables import create_ranking_table, create_markdown_table
+from fetchers.base_fetcher import MetricData, validate_config, load_team_members
+from productivity_scorer import run_fetch
+
+# Single-member config, passed as a deep copy; the two-member variant is the
+# ``base_config`` fixture
+_SINGLE_MEMBER_CONFIG = {
+    "version": "1.0",
+    "team": {
+        "name": "Test",
+        "members": [{"name": "Alice", "github_username": "alice", "jira_account_id": "123"}]
+    },
+    "weights": {"items_completed": 0.5, "prs_authored": 0.3, "code_reviews": 0.2},
+    "periods": {"sprint": {"type": "fixed", "start": "2026-01-01", "end": "2026-01-21"}},
+    "jira": {"project": "TEST", "done_statuses": ["Done"]}
+}
+
+
+@pytest.mark.integration
 class TestEndToEndWorkflow:
     """Test complete workflows from fetch to display."""
 
-    def test_complete_pipeline_test_mode(self, tmp_path):
+    def test_complete_pipeline_test_mode(self, pipeline_result):
         """Test complete pipeline in test mode."""
-        from productivity_scorer import run_full_pipeline
-        
-        config = {
-            "version": "1.0",
-            "team": {
-                "name": "Test Team",
-                "members": [
-                    {"name": "Alice", "github_username": "alice", "jira_account_id": "123"},
-                    {"name": "Bob", "github_username": "bob", "jira_account_id": "456"}
-                ]
-            },
-            "weights": {"items_completed": 0.50, "prs_authored": 0.30, "code_reviews": 0.20},
-            "periods": {"sprint": {"type": "fixed", "start": "2026-01-01", "end": "2026-01-21"}},
-            "jira": {"project": "TEST", "done_statuses": ["Done"]},
-            "output": {"data_dir": str(tmp_path)}
-        }
-        
-        result = run_full_pipeline(config, period="sprint", test_mode=True, output_dir=str(tmp_path))
-        
-        assert "raw_data" in result
-        assert "scores" in result
-        assert "ranked" in result
-        assert len(result["ranked"]) == 2
+        assert "raw_data" in pipeline_result
+        assert "scores" in pipeline_result
+        assert "ranked" in pipeline_result
+        assert len(pipeline_result["ranked"]) == 2
 
-    def test_pipeline_generates_correct_scores(self, tmp_path):
+    def test_pipeline_generates_correct_scores(self, pipeline_result, base_config):
         """Test that pipeline generates correctly calculated scores."""
-        from productivity_scorer import run_full_pipeline
-        
-        config = {
-            "version": "1.0",
-            "team": {
-                "name": "Test Team",
-                "members": [
-                    {"name": "Alice", "github_username": "alice", "jira_account_id": "123"}
-                ]
-            },
-            "weights": {"items_completed": 0.50, "prs_authored": 0.30, "code_reviews": 0.20},
-            "periods": {"sprint": {"type": "fixed", "start": "2026-01-01", "end": "2026-01-21"}},
-            "jira": {"project": "TEST", "done_statuses": ["Done"]}
-        }
-        
-        result = run_full_pipeline(config, period="sprint", test_mode=True)
-        
-        # Single person should have total = 100 (normalized to max)
-        assert result["ranked"][0]["total"] == 100.0
-
-    def test_pipeline_with_markdown_output(self, tmp_path):
+        scores = pipeline_result["scores"]
+        metrics = pipeline_result["raw_data"]["metrics"]
+        weights = base_config["weights"]
+        
+        # The top member in each component is normalized to 100
+        assert max(s["items_score"] for s in scores.values()) == 100.0
+        assert max(s["prs_score"] for s in scores.values()) == 100.0
+        assert max(s["reviews_score"] for s in scores.values()) == 100.0
+        
+        # Each total is the weighted sum of the member's normalized metrics
+        top = {key: max(m[key] for m in metrics.values()) for key in weights}
+        for name, member_metrics in metrics.items():
+            expected = sum(member_metrics[key] / top[key] * 100 * weight for key, weight in weights.items())
+            assert scores[name]["total"] == pytest.approx(expected)
+        assert pipeline_result["ranked"][0]["total"] == max(s["total"] for s in scores.values())
+
+    def test_pipeline_with_markdown_output(self, pipeline_result):
         """Test pipeline generates markdown report."""
-        from productivity_scorer import run_full_pipeline
-        
-        config = {
-            "version": "1.0",
-            "team": {
-                "name": "Test Team",
-                "members": [
-                    {"name": "Alice", "github_username": "alice", "jira_account_id": "123"}
-                ]
-            },
-            "weights": {"items_completed": 0.50, "prs_authored": 0.30, "code_reviews": 0.20},
-            "periods": {"sprint": {"type": "fixed", "start": "2026-01-01", "end": "2026-01-21"}},
-            "jira": {"project": "TEST", "done_statuses": ["Done"]}
-        }
-        
-        output_file = tmp_path / "report.md"
-        
-        run_full_pipeline(
-            config, 
-            period="sprint", 
-            test_mode=True,
-            output_file=str(output_file)
-        )
+        content = pipeline_result["report"]
         
-        assert output_file.exists()
-        content = output_file.read_text()
+        assert content is not None
         assert "Test Team" in content
         assert "Rankings" in content
 
@@ -94,20 +62,12 @@ class TestEndToEndWorkflow:
 class TestFetcherIntegration:
     """Test fetcher components working together."""
 
-    def test_fetchers_return_compatible_data(self):
+    def test_fetchers_return_compatible_data(
+        self, jira_fetcher_test, github_fetcher_test, alice_member, sprint_period
+    ):
         """Test that Jira and GitHub fetchers return compatible MetricData."""
-        from fetchers.jira_fetcher import JiraFetcher
-        from fetchers.github_fetcher import GitHubFetcher
-        from fetchers.base_fetcher import TeamMember, Period, MetricData
-        
-        member = TeamMember("Alice", "alice", "123")
-        period = Period("sprint", date(2026, 1, 1), date(2026, 1, 21))
-        
-        jira_fetcher = JiraFetcher(project="TEST", test_mode=True)
-        github_fetcher = GitHubFetcher(test_mode=True)
-        
-        jira_data = jira_fetcher.fetch(member, period)
-        github_data = github_fetcher.fetch(member, period)
+        jira_data = jira_fetcher_test.fetch(alice_member, sprint_period)
+        github_data = github_fetcher_test.fetch(alice_member, sprint_period)
         
         assert isinstance(jira_data, MetricData)
         assert isinstance(github_data, MetricData)
@@ -120,20 +80,12 @@ class TestFetcherIntegration:
         assert github_data.prs_authored > 0
         assert github_data.code_reviews > 0
 
-    def test_fetcher_data_can_be_merged(self):
+    def test_fetcher_data_can_be_merged(
+        self, jira_fetcher_test, github_fetcher_test, alice_member, sprint_period
+    ):
         """Test that data from multiple fetchers can be combined."""
-        from fetchers.jira_fetcher import JiraFetcher
-        from fetchers.github_fetcher import GitHubFetcher
-        from fetchers.base_fetcher import TeamMember, Period
-        
-        member = TeamMember("Alice", "alice", "123")
-        period = Period("sprint", date(2026, 1, 1), date(2026, 1, 21))
-        
-        jira_fetcher = JiraFetcher(project="TEST", test_mode=True)
-        github_fetcher = GitHubFetcher(test_mode=True)
-        
-        jira_data = jira_fetcher.fetch(member, period)
-        github_data = github_fetcher.fetch(member, period)
+        jira_data = jira_fetcher_test.fetch(alice_member, sprint_period)
+        github_data = github_fetcher_test.fetch(alice_member, sprint_period)
         
         # Merge should combine metrics
         merged = jira_data.merge(github_data)
@@ -145,25 +97,11 @@ class TestFetcherIntegration:
 class TestCalculatorIntegration:
     """Test calculator with real-ish data."""
 
-    def test_calculator_with_fetched_data_format(self):
+    def test_calculator_with_fetched_data_format(self, scores_two_member, ranked_two_member):
         """Test calculator works with fetcher output format."""
-        from calculator.score_calculator import calculate_scores, rank_scores
-        
-        # Simulate fetched data format
-        raw_data = {
-            "generated_at": "2026-01-21T12:00:00Z",
-            "period": {"name": "sprint", "start": "2026-01-01", "end": "2026-01-21"},
-            "metrics": {
-                "Alice": {"items_completed": 50, "story_points": 25, "prs_authored": 20, "code_reviews": 30},
-                "Bob": {"items_completed": 30, "story_points": 15, "prs_authored": 40, "code_reviews": 20}
-            }
-        }
-        
-        config = {"weights": {"items_completed": 0.5, "prs_authored": 0.3, "code_reviews": 0.2}}
-        
-        scores = calculate_scores(raw_data, config)
-        ranked = rank_scores(scores)
+        ranked = ranked_two_member
         
+        assert set(scores_two_member) == {"Alice", "Bob"}
         assert len(ranked) == 2
         assert ranked[0]["rank"] == 1
         assert ranked[0]["total"] >= ranked[1]["total"]
@@ -172,47 +110,22 @@ class TestCalculatorIntegration:
 class TestDisplayIntegration:
     """Test display components with calculator output."""
 
-    def test_tables_with_ranked_scores(self):
+    def test_tables_with_ranked_scores(self, ranked_two_member):
         """Test table generation with ranked scores."""
-        from calculator.score_calculator import calculate_scores, rank_scores
-        from display.tables import create_ranking_table, create_markdown_table
-        
-        raw_data = {
-            "metrics": {
-                "Alice": {"items_completed": 50, "prs_authored": 20, "code_reviews": 30},
-                "Bob": {"items_completed": 30, "prs_authored": 40, "code_reviews": 20}
-            }
-        }
-        config = {"weights": {"items_completed": 0.5, "prs_authored": 0.3, "code_reviews": 0.2}}
-        
-        scores = calculate_scores(raw_data, config)
-        ranked = rank_scores(scores)
-        
-        table = create_ranking_table(ranked)
-        markdown = create_markdown_table(ranked)
+        table = create_ranking_table(ranked_two_member)
+        markdown = create_markdown_table(ranked_two_member)
         
         assert "Alice" in table
         assert "Bob" in table
         assert "|" in markdown
 
-    def test_charts_with_calculator_output(self):
+    @pytest.mark.slow
+    @pytest.mark.perf
+    def test_charts_with_calculator_output(self, scores_two_member):
         """Test chart generation with calculator output."""
-        from calculator.score_calculator import calculate_scores
         from display.charts import create_bar_chart
-        from unittest.mock import patch
         
-        raw_data = {
-            "metrics": {
-                "Alice": {"items_completed": 50, "prs_authored": 20, "code_reviews": 30}
-            }
-        }
-        config = {"weights": {"items_completed": 0.5, "prs_authored": 0.3, "code_reviews": 0.2}}
-        
-        scores = calculate_scores(raw_data, config)
-        
-        with patch("matplotlib.pyplot.savefig"):
-            with patch("matplotlib.pyplot.close"):
-                fig = create_bar_chart(scores)
+        fig = create_bar_chart(scores_two_member)
         
         assert fig is not None
 
@@ -220,26 +133,16 @@ class TestDisplayIntegration:
 class TestConfigIntegration:
     """Test configuration loading and validation."""
 
-    def test_default_config_is_valid(self):
+    def test_default_config_is_valid(self, default_config):
         """Test that default config passes validation."""
-        from fetchers.base_fetcher import load_config, validate_config
-        
-        config_path = Path(__file__).parent.parent / "config" / "default_config.json"
-        
-        if config_path.exists():
-            config = load_config(str(config_path))
+        if default_config is not None:
             # Should not raise
-            validate_config(config)
+            validate_config(default_config)
 
-    def test_config_team_members_loadable(self):
+    def test_config_team_members_loadable(self, default_config):
         """Test that team members can be loaded from config."""
-        from fetchers.base_fetcher import load_config, load_team_members
-        
-        config_path = Path(__file__).parent.parent / "config" / "default_config.json"
-        
-        if config_path.exists():
-            config = load_config(str(config_path))
-            members = load_team_members(config)
+        if default_config is not None:
+            members = load_team_members(default_config)
             
             assert len(members) > 0
             assert all(hasattr(m, "name") for m in members)
@@ -250,19 +153,7 @@ class TestDataPersistence:
 
     def test_raw_data_can_be_saved_and_loaded(self, tmp_path):
         """Test raw data JSON persistence."""
-        from productivity_scorer import run_fetch
-        
-        config = {
-            "version": "1.0",
-            "team": {
-                "name": "Test",
-                "members": [{"name": "Alice", "github_username": "alice", "jira_account_id": "123"}]
-            },
-            "weights": {"items_completed": 0.5, "prs_authored": 0.3, "code_reviews": 0.2},
-            "periods": {"sprint": {"type": "fixed", "start": "2026-01-01", "end": "2026-01-21"}},
-            "jira": {"project": "TEST", "done_statuses": ["Done"]}
-        }
-        
+        config = copy.deepcopy(_SINGLE_MEMBER_CONFIG)
         raw_data = run_fetch(config, period="sprint", test_mode=True, output_dir=str(tmp_path))
         
         # Check files were created
@@ -1,114 +1,110 @@
 """Tests for the productivity scorer CLI entry point."""
 import pytest
 import json
-from pathlib import Path
 from unittest.mock import patch, MagicMock
-import sys
 from io import StringIO
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+
+@pytest.fixture(scope="module")
+def workdir(tmp_path_factory):
+    """Scratch directory shared by this module; tests use unique filenames."""
+    return tmp_path_factory.mktemp("ps")
+
+
+@pytest.fixture(scope="module")
+def base_config_file(tmp_path_factory, base_config_json):
+    """base_config serialized to a JSON file once per module."""
+    config_file = tmp_path_factory.mktemp("cfg") / "config.json"
+    config_file.write_text(base_config_json)
+    return config_file
+
+
+@pytest.fixture(scope="module")
+def raw_json_file(tmp_path_factory, two_member_metrics):
+    """two_member_metrics written to raw.json once per module."""
+    data_file = tmp_path_factory.mktemp("raw") / "raw.json"
+    data_file.write_text(json.dumps(two_member_metrics))
+    return data_file
+
+
+@pytest.fixture(scope="module")
+def scores_json_file(tmp_path_factory, scores_two_member):
+    """scores_two_member written to scores.json once per module."""
+    scores_file = tmp_path_factory.mktemp("scores") / "scores.json"
+    scores_file.write_text(json.dumps(scores_two_member))
+    return scores_file
+
+
+_PARSE_CASES = [
+    pytest.param(
+        ["fetch", "--period", "sprint", "--config", "config.json"],
+        {"command": "fetch", "period": "sprint", "config": "config.json"},
+        id="fetch",
+    ),
+    pytest.param(
+        ["score", "--data", "raw.json", "--config", "config.json"],
+        {"command": "score", "data": "raw.json"},
+        id="score",
+    ),
+    pytest.param(
+        ["display", "--type", "bar", "--data", "scores.json"],
+        {"command": "display", "type": "bar"},
+        id="display",
+    ),
+    pytest.param(
+        ["run", "--period", "sprint", "--output", "report.md"],
+        {"command": "run", "period": "sprint", "output": "report.md"},
+        id="run",
+    ),
+    pytest.param(["fetch", "--test"], {"test": True}, id="test_mode_flag"),
+    pytest.param(["fetch"], {"config": "config/default_config.json"}, id="default_config"),
+]
+
+
+# (command, argv builder taking config, workdir, raw data and scores files)
+_MAIN_CASES = [
+    ("fetch", lambda cfg, wd, raw, scores: [
+        "fetch", "--period", "sprint", "--config", str(cfg), "--test"]),
+    ("score", lambda cfg, wd, raw, scores: [
+        "score", "--data", str(raw), "--config", str(cfg)]),
+    ("display", lambda cfg, wd, raw, scores: [
+        "display", "--type", "table", "--data", str(scores)]),
+    ("run", lambda cfg, wd, raw, scores: [
+        "run", "--period", "sprint", "--config", str(cfg),
+        "--output", str(wd / "report_main_run.md"), "--test"]),
+]
 
 
 class TestCLIParsing:
     """Tests for CLI argument parsing."""
 
-    def test_parse_fetch_command(self):
-        """Test parsing fetch command."""
-        from productivity_scorer import parse_args
-        
-        args = parse_args(["fetch", "--period", "sprint", "--config", "config.json"])
-        
-        assert args.command == "fetch"
-        assert args.period == "sprint"
-        assert args.config == "config.json"
-
-    def test_parse_score_command(self):
-        """Test parsing score command."""
-        from productivity_scorer import parse_args
-        
-        args = parse_args(["score", "--data", "raw.json", "--config", "config.json"])
-        
-        assert args.command == "score"
-        assert args.data == "raw.json"
-
-    def test_parse_display_command(self):
-        """Test parsing display command."""
-        from productivity_scorer import parse_args
-        
-        args = parse_args(["display", "--type", "bar", "--data", "scores.json"])
-        
-        assert args.command == "display"
-        assert args.type == "bar"
-
-    def test_parse_run_command(self):
-        """Test parsing run (all-in-one) command."""
-        from productivity_scorer import parse_args
-        
-        args = parse_args(["run", "--period", "sprint", "--output", "report.md"])
-        
-        assert args.command == "run"
-        assert args.period == "sprint"
-        assert args.output == "report.md"
-
-    def test_parse_test_mode_flag(self):
-        """Test parsing --test flag."""
-        from productivity_scorer import parse_args
-        
-        args = parse_args(["fetch", "--test"])
-        
-        assert args.test is True
-
-    def test_parse_default_config(self):
-        """Test default config path."""
-        from productivity_scorer import parse_args
+    @pytest.mark.parametrize("argv,expected", _PARSE_CASES)
+    def test_parse_args(self, ps, argv, expected):
+        """Test parsed namespace attributes for each command."""
+        args = ps.parse_args(argv)
         
-        args = parse_args(["fetch"])
-        
-        # Should have default config path
-        assert args.config is not None or hasattr(args, 'config')
+        for attr, value in expected.items():
+            assert getattr(args, attr) == value
 
 
 class TestFetchCommand:
     """Tests for the fetch command."""
 
-    def test_fetch_creates_raw_data_file(self, tmp_path):
+    def test_fetch_creates_raw_data_file(self, ps, tmp_path, base_config):
         """Test that fetch creates a raw data file."""
-        from productivity_scorer import run_fetch
-        
-        config = {
-            "version": "1.0",
-            "team": {
-                "name": "Test",
-                "members": [{"name": "Alice", "github_username": "alice", "jira_account_id": "123"}]
-            },
-            "weights": {"items_completed": 0.5, "prs_authored": 0.3, "code_reviews": 0.2},
-            "periods": {"sprint": {"type": "fixed", "start": "2026-01-01", "end": "2026-01-21"}},
-            "jira": {"project": "TEST", "done_statuses": ["Done"]},
-            "output": {"data_dir": str(tmp_path)}
-        }
+        run_fetch = ps.run_fetch
         
-        result = run_fetch(config, period="sprint", test_mode=True, output_dir=str(tmp_path))
+        result = run_fetch(base_config, period="sprint", test_mode=True, output_dir=str(tmp_path))
         
         assert result is not None
         assert "metrics" in result
 
-    def test_fetch_test_mode_no_api_calls(self):
+    def test_fetch_test_mode_no_api_calls(self, ps, base_config):
         """Test that test mode doesn't make API calls."""
-        from productivity_scorer import run_fetch
-        
-        config = {
-            "version": "1.0",
-            "team": {
-                "name": "Test",
-                "members": [{"name": "Alice", "github_username": "alice", "jira_account_id": "123"}]
-            },
-            "weights": {"items_completed": 0.5, "prs_authored": 0.3, "code_reviews": 0.2},
-            "periods": {"sprint": {"type": "fixed", "start": "2026-01-01", "end": "2026-01-21"}},
-            "jira": {"project": "TEST", "done_statuses": ["Done"]}
-        }
+        run_fetch = ps.run_fetch
         
         with patch("subprocess.run") as mock_run:
-            run_fetch(config, period="sprint", test_mode=True)
+            run_fetch(base_config, period="sprint", test_mode=True)
             # Should not call subprocess in test mode
             mock_run.assert_not_called()
 
@@ -116,135 +112,78 @@ class TestFetchCommand:
 class TestScoreCommand:
     """Tests for the score command."""
 
-    def test_score_calculates_from_raw_data(self):
+    def test_score_calculates_from_raw_data(self, ps, two_member_metrics, standard_weights_config):
         """Test that score command calculates from raw data."""
-        from productivity_scorer import run_score
-        
-        raw_data = {
-            "metrics": {
-                "Alice": {"items_completed": 50, "prs_authored": 20, "code_reviews": 30}
-            }
-        }
-        
-        config = {
-            "weights": {"items_completed": 0.5, "prs_authored": 0.3, "code_reviews": 0.2}
-        }
-        
-        scores = run_score(raw_data, config)
+        scores = ps.run_score(two_member_metrics, standard_weights_config)
         
         assert "Alice" in scores
         assert "total" in scores["Alice"]
 
-    def test_score_returns_ranked_list(self):
+    def test_score_returns_ranked_list(self, ps, two_member_metrics, standard_weights_config, scores_two_member):
         """Test that score command returns ranked list."""
-        from productivity_scorer import run_score
-        
-        raw_data = {
-            "metrics": {
-                "Alice": {"items_completed": 50, "prs_authored": 20, "code_reviews": 30},
-                "Bob": {"items_completed": 30, "prs_authored": 40, "code_reviews": 20}
-            }
-        }
-        
-        config = {
-            "weights": {"items_completed": 0.5, "prs_authored": 0.3, "code_reviews": 0.2}
-        }
-        
-        scores = run_score(raw_data, config)
+        scores = ps.run_score(two_member_metrics, standard_weights_config)
         
         assert len(scores) == 2
+        assert scores == scores_two_member
 
 
 class TestDisplayCommand:
     """Tests for the display command."""
 
-    def test_display_bar_chart(self):
+    def test_display_bar_chart(self, ps, scores_two_member):
         """Test displaying bar chart."""
-        from productivity_scorer import run_display
-        
-        scores = {
-            "Alice": {"items_weighted": 50.0, "prs_weighted": 25.0, "reviews_weighted": 20.0, "total": 95.0}
-        }
-        
         with patch("productivity_scorer.create_bar_chart") as mock_chart:
             mock_chart.return_value = MagicMock()
-            run_display(scores, display_type="bar")
+            ps.run_display(scores_two_member, display_type="bar")
             mock_chart.assert_called()
 
-    def test_display_ranking(self, capsys):
-        """Test displaying ranking table."""
-        from productivity_scorer import run_display
+    def test_display_ranking(self, ps, scores_two_member):
+        """Test displaying ranking chart."""
+        with patch("productivity_scorer.create_ranking_chart") as mock_chart:
+            ps.run_display(scores_two_member, display_type="ranking")
         
-        scores = {
-            "Alice": {"items_weighted": 50.0, "prs_weighted": 25.0, "reviews_weighted": 20.0, "total": 95.0}
-        }
-        
-        run_display(scores, display_type="ranking")
-        
-        captured = capsys.readouterr()
-        assert "Alice" in captured.out or True  # May not print if returning
+        ranked = mock_chart.call_args[0][0]
+        assert [row["name"] for row in ranked] == ["Alice", "Bob"]
+        assert [row["rank"] for row in ranked] == [1, 2]
 
 
 class TestRunCommand:
     """Tests for the run (all-in-one) command."""
 
-    def test_run_executes_full_pipeline(self, tmp_path):
+    def test_run_executes_full_pipeline(self, ps, tmp_path, base_config):
         """Test that run executes fetch, score, and display."""
-        from productivity_scorer import run_full_pipeline
-        
-        config = {
-            "version": "1.0",
-            "team": {
-                "name": "Test",
-                "members": [{"name": "Alice", "github_username": "alice", "jira_account_id": "123"}]
-            },
-            "weights": {"items_completed": 0.5, "prs_authored": 0.3, "code_reviews": 0.2},
-            "periods": {"sprint": {"type": "fixed", "start": "2026-01-01", "end": "2026-01-21"}},
-            "jira": {"project": "TEST", "done_statuses": ["Done"]},
-            "output": {"data_dir": str(tmp_path)}
-        }
+        run_full_pipeline = ps.run_full_pipeline
         
-        result = run_full_pipeline(config, period="sprint", test_mode=True, output_dir=str(tmp_path))
+        result = run_full_pipeline(base_config, period="sprint", test_mode=True, output_dir=str(tmp_path))
         
         assert result is not None
         assert "scores" in result or "ranked" in result
 
-    def test_run_generates_markdown_report(self, tmp_path):
+    def test_run_generates_markdown_report(self, ps, tmp_path, base_config):
         """Test that run generates markdown report."""
-        from productivity_scorer import run_full_pipeline
-        
-        config = {
-            "version": "1.0",
-            "team": {
-                "name": "Test",
-                "members": [{"name": "Alice", "github_username": "alice", "jira_account_id": "123"}]
-            },
-            "weights": {"items_completed": 0.5, "prs_authored": 0.3, "code_reviews": 0.2},
-            "periods": {"sprint": {"type": "fixed", "start": "2026-01-01", "end": "2026-01-21"}},
-            "jira": {"project": "TEST", "done_statuses": ["Done"]},
-            "output": {"data_dir": str(tmp_path)}
-        }
+        run_full_pipeline = ps.run_full_pipeline
         
         output_path = tmp_path / "report.md"
         
         run_full_pipeline(
-            config,
+            base_config,
             period="sprint",
             test_mode=True,
             output_dir=str(tmp_path),
             output_file=str(output_path)
         )
         
-        # Report should be generated
-        assert output_path.exists() or True  # File creation is optional
+        # Report is always written when output_file is given
+        assert output_path.exists()
+        assert "## Rankings" in output_path.read_text()
 
 
 class TestConfigLoading:
     """Tests for configuration loading in CLI."""
 
-    def test_load_config_from_file(self, tmp_path):
+    def test_load_config_from_file(self, ps, workdir):
         """Test loading config from file in CLI."""
-        from productivity_scorer import load_cli_config
+        load_cli_config = ps.load_cli_config
         
         config_data = {
             "version": "1.0",
@@ -254,29 +193,30 @@ class TestConfigLoading:
             "jira": {"project": "TEST", "done_statuses": ["Done"]}
         }
         
-        config_file = tmp_path / "config.json"
+        config_file = workdir / "cfg_load.json"
         config_file.write_text(json.dumps(config_data))
         
         config = load_cli_config(str(config_file))
         
         assert config["version"] == "1.0"
 
-    def test_load_default_config(self):
+    def test_load_default_config(self, ps):
         """Test loading default config when no file specified."""
-        from productivity_scorer import load_cli_config
+        load_cli_config = ps.load_cli_config
         
         # Should load from config/default_config.json
         config = load_cli_config(None)
         
-        assert config is not None or True  # May return None if not found
+        assert isinstance(config, dict)
+        assert "weights" in config
 
 
 class TestErrorHandling:
     """Tests for CLI error handling."""
 
-    def test_invalid_period_error(self):
+    def test_invalid_period_error(self, ps):
         """Test error handling for invalid period."""
-        from productivity_scorer import run_fetch
+        run_fetch = ps.run_fetch
         
         config = {
             "version": "1.0",
@@ -289,182 +229,89 @@ class TestErrorHandling:
         # Invalid period should be handled gracefully
         result = run_fetch(config, period="nonexistent", test_mode=True)
         
-        assert result is None or "error" in str(result).lower() or True
+        assert result is None
 
-    def test_missing_config_error(self):
+    def test_missing_config_error(self, ps):
         """Test error handling for missing config."""
-        from productivity_scorer import load_cli_config, ConfigError
+        load_cli_config = ps.load_cli_config
+        ConfigError = ps.ConfigError
         
         with pytest.raises((ConfigError, FileNotFoundError, Exception)):
             load_cli_config("/nonexistent/config.json")
 
 
+class TestLoadJsonFile:
+    """Tests for cached JSON data loading."""
+
+    def test_unchanged_file_is_parsed_once(self, ps, raw_json_file, two_member_metrics):
+        """Test repeated loads of an unchanged file reuse the parsed object."""
+        first = ps.load_json_file(str(raw_json_file))
+        second = ps.load_json_file(str(raw_json_file))
+        
+        assert first == two_member_metrics
+        assert first is second
+
+    def test_modified_file_is_reparsed(self, ps, workdir):
+        """Test that rewriting a file invalidates the cached parse."""
+        data_file = workdir / "data_reparse.json"
+        data_file.write_text(json.dumps({"v": 1}))
+        assert ps.load_json_file(str(data_file)) == {"v": 1}
+        
+        data_file.write_text(json.dumps({"v": 22}))
+        
+        assert ps.load_json_file(str(data_file)) == {"v": 22}
+
+
 class TestMainFunction:
     """Tests for the main() entry point function."""
     
-    def test_main_no_command_exits(self, monkeypatch, capsys):
+    def test_main_no_command_exits(self, ps, capsys):
         """Test main exits with error when no command given."""
-        from productivity_scorer import main
+        main = ps.main
         
-        # Mock sys.argv with no command
-        monkeypatch.setattr(sys, "argv", ["productivity_scorer.py"])
+        # No command
+        argv = []
         
         with pytest.raises(SystemExit) as exc_info:
-            main()
+            main(argv)
         
         assert exc_info.value.code == 1
         output = capsys.readouterr()
         assert "No command specified" in output.out
     
-    def test_main_fetch_command(self, tmp_path, monkeypatch):
-        """Test main with fetch command."""
-        from productivity_scorer import main
-        
-        config = {
-            "version": "1.0",
-            "team": {"name": "Test", "members": [
-                {"name": "Alice", "github_username": "alice", "jira_account_id": "123"}
-            ]},
-            "weights": {"items_completed": 0.5, "prs_authored": 0.3, "code_reviews": 0.2},
-            "periods": {"sprint": {"type": "fixed", "start": "2026-01-01", "end": "2026-01-21"}},
-            "jira": {"project": "TEST", "done_statuses": ["Done"]},
-            "output": {"data_dir": str(tmp_path)}
-        }
-        config_file = tmp_path / "config.json"
-        config_file.write_text(json.dumps(config))
-        
-        monkeypatch.setattr(sys, "argv", [
-            "productivity_scorer.py", "fetch",
-            "--period", "sprint",
-            "--config", str(config_file),
-            "--test"
-        ])
-        
-        # Should not raise
-        main()
+    @pytest.mark.parametrize("name,build", _MAIN_CASES, ids=[c[0] for c in _MAIN_CASES])
+    def test_main_commands(self, ps, base_config_file, workdir, raw_json_file,
+                           scores_json_file, name, build):
+        """Test main dispatches each command without raising."""
+        ps.main(build(base_config_file, workdir, raw_json_file, scores_json_file))
     
-    def test_main_score_command(self, tmp_path, monkeypatch):
-        """Test main with score command."""
-        from productivity_scorer import main
-        
-        config = {
-            "version": "1.0",
-            "team": {"name": "Test", "members": []},
-            "weights": {"items_completed": 0.5, "prs_authored": 0.3, "code_reviews": 0.2},
-            "periods": {},
-            "jira": {"project": "TEST", "done_statuses": ["Done"]}
-        }
-        config_file = tmp_path / "config.json"
-        config_file.write_text(json.dumps(config))
-        
-        raw_data = {
-            "metrics": {
-                "Alice": {"items_completed": 10, "prs_authored": 5, "code_reviews": 3}
-            }
-        }
-        data_file = tmp_path / "raw.json"
-        data_file.write_text(json.dumps(raw_data))
-        
-        monkeypatch.setattr(sys, "argv", [
-            "productivity_scorer.py", "score",
-            "--data", str(data_file),
-            "--config", str(config_file)
-        ])
-        
-        main()
-    
-    def test_main_display_command(self, tmp_path, monkeypatch):
-        """Test main with display command."""
-        from productivity_scorer import main
-        
-        # Scores need to be a dict for run_display
-        scores = {
-            "Alice": {
-                "items_score": 50.0, "prs_score": 30.0, "reviews_score": 20.0,
-                "items_weighted": 25.0, "prs_weighted": 9.0, "reviews_weighted": 4.0, "total": 38.0
-            }
-        }
-        scores_file = tmp_path / "scores.json"
-        scores_file.write_text(json.dumps(scores))
-        
-        monkeypatch.setattr(sys, "argv", [
-            "productivity_scorer.py", "display",
-            "--type", "table",
-            "--data", str(scores_file)
-        ])
-        
-        main()
-    
-    def test_main_run_command(self, tmp_path, monkeypatch):
-        """Test main with run command."""
-        from productivity_scorer import main
-        
-        config = {
-            "version": "1.0",
-            "team": {"name": "Test", "members": [
-                {"name": "Alice", "github_username": "alice", "jira_account_id": "123"}
-            ]},
-            "weights": {"items_completed": 0.5, "prs_authored": 0.3, "code_reviews": 0.2},
-            "periods": {"sprint": {"type": "fixed", "start": "2026-01-01", "end": "2026-01-21"}},
-            "jira": {"project": "TEST", "done_statuses": ["Done"]},
-            "output": {"data_dir": str(tmp_path)}
-        }
-        config_file = tmp_path / "config.json"
-        config_file.write_text(json.dumps(config))
-        
-        output_file = tmp_path / "report.md"
-        
-        monkeypatch.setattr(sys, "argv", [
-            "productivity_scorer.py", "run",
-            "--period", "sprint",
-            "--config", str(config_file),
-            "--output", str(output_file),
-            "--test"
-        ])
-        
-        main()
-    
-    def test_main_config_error_exits(self, monkeypatch, capsys):
+    def test_main_config_error_exits(self, ps):
         """Test main exits on config error."""
-        from productivity_scorer import main
+        main = ps.main
         
-        monkeypatch.setattr(sys, "argv", [
-            "productivity_scorer.py", "run",
+        argv = [
+            "run",
             "--period", "sprint",
             "--config", "/nonexistent/config.json"
-        ])
+        ]
         
         with pytest.raises(SystemExit) as exc_info:
-            main()
+            main(argv)
         
         assert exc_info.value.code == 1
     
-    def test_main_generic_error_prints_message(self, tmp_path, monkeypatch, capsys):
+    def test_main_generic_error_prints_message(self, ps, base_config_file, capsys):
         """Test main handles errors and prints message."""
-        from productivity_scorer import main
-        
-        config = {
-            "version": "1.0",
-            "team": {"name": "Test", "members": []},
-            "weights": {"items_completed": 0.5, "prs_authored": 0.3, "code_reviews": 0.2},
-            "periods": {},  # No periods defined
-            "jira": {"project": "TEST", "done_statuses": ["Done"]}
-        }
-        config_file = tmp_path / "config.json"
-        config_file.write_text(json.dumps(config))
+        main = ps.main
         
-        monkeypatch.setattr(sys, "argv", [
-            "productivity_scorer.py", "run",
-            "--period", "nonexistent_period",
-            "--config", str(config_file)
-        ])
+        argv = [
+            "run",
+            "--period", "nonexistent_period",  # Not defined in base_config
+            "--config", str(base_config_file)
+        ]
         
-        # The function may print error and not exit, depending on implementation
-        try:
-            main()
-        except SystemExit:
-            pass  # Expected in some cases
+        # A missing period is reported, not raised
+        main(argv)
         
         output = capsys.readouterr()
-        # Should have some error output about the period
-        assert "nonexistent_period" in output.out or "Error" in output.out or True
+        assert "Error: Period 'nonexistent_period' not found" in output.out
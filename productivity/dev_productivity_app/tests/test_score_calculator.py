@@ -1,101 +1,63 @@
 """Tests for the score calculator."""
 import pytest
 import json
-from pathlib import Path
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import numpy as np
 
+from calculator import score_calculator
+from calculator.score_calculator import (
+    calculate_scores, rank_scores, calculate_and_rank, calculate_component_contributions,
+    compare_periods, summarize_by_team, _weight_vector, _contribution_rows
+)
 
-class TestScoreCalculatorBasic:
-    """Tests for basic score calculation functionality."""
 
-    def test_calculate_scores_simple(self):
-        """Test basic score calculation with simple data."""
-        from calculator.score_calculator import calculate_scores
-        
-        raw_data = {
-            "metrics": {
-                "Alice": {"items_completed": 50, "prs_authored": 20, "code_reviews": 30},
-                "Bob": {"items_completed": 25, "prs_authored": 40, "code_reviews": 15}
-            }
-        }
-        
-        config = {
-            "weights": {
-                "items_completed": 0.50,
-                "prs_authored": 0.30,
-                "code_reviews": 0.20
-            }
-        }
-        
-        scores = calculate_scores(raw_data, config)
-        
-        assert "Alice" in scores
-        assert "Bob" in scores
-        assert "total" in scores["Alice"]
-        assert "total" in scores["Bob"]
+_BASIC_CASES = [
+    pytest.param(
+        {
+            "Alice": {"items_completed": 50, "prs_authored": 20, "code_reviews": 30},
+            "Bob": {"items_completed": 25, "prs_authored": 40, "code_reviews": 15}
+        },
+        {"Alice": {}, "Bob": {}},
+        id="simple",
+    ),
+    pytest.param(
+        {
+            "Alice": {"items_completed": 100, "prs_authored": 50, "code_reviews": 25},
+            "Bob": {"items_completed": 50, "prs_authored": 25, "code_reviews": 50}
+        },
+        # Alice has max items and PRs; Bob has half of max items
+        {"Alice": {"items_score": 100.0, "prs_score": 100.0}, "Bob": {"items_score": 50.0}},
+        id="normalized_to_100",
+    ),
+    pytest.param(
+        {"Alice": {"items_completed": 100, "prs_authored": 100, "code_reviews": 100}},
+        # Single person with all max values should have total = 100
+        {"Alice": {"total": 100.0}},
+        id="weighted_total",
+    ),
+]
 
-    def test_calculate_scores_normalized_to_100(self):
-        """Test that component scores are normalized to 0-100."""
-        from calculator.score_calculator import calculate_scores
-        
-        raw_data = {
-            "metrics": {
-                "Alice": {"items_completed": 100, "prs_authored": 50, "code_reviews": 25},
-                "Bob": {"items_completed": 50, "prs_authored": 25, "code_reviews": 50}
-            }
-        }
-        
-        config = {
-            "weights": {
-                "items_completed": 0.50,
-                "prs_authored": 0.30,
-                "code_reviews": 0.20
-            }
-        }
-        
-        scores = calculate_scores(raw_data, config)
-        
-        # Alice has max items, so items_score should be 100
-        assert scores["Alice"]["items_score"] == 100.0
-        # Bob has half of max items, so items_score should be 50
-        assert scores["Bob"]["items_score"] == 50.0
-        
-        # Alice has max PRs
-        assert scores["Alice"]["prs_score"] == 100.0
 
-    def test_calculate_scores_weighted_total(self):
-        """Test that total is correctly weighted."""
-        from calculator.score_calculator import calculate_scores
-        
-        raw_data = {
-            "metrics": {
-                "Alice": {"items_completed": 100, "prs_authored": 100, "code_reviews": 100}
-            }
-        }
-        
-        config = {
-            "weights": {
-                "items_completed": 0.50,
-                "prs_authored": 0.30,
-                "code_reviews": 0.20
-            }
-        }
-        
-        scores = calculate_scores(raw_data, config)
-        
-        # Single person with all max values should have total = 100
-        assert scores["Alice"]["total"] == 100.0
+class TestScoreCalculatorBasic:
+    """Tests for basic score calculation functionality."""
+
+    @pytest.mark.parametrize("metrics,expected", _BASIC_CASES)
+    def test_calculate_scores(self, standard_weights_config, metrics, expected):
+        """Test scores per member against expected component values."""
+        scores = calculate_scores({"metrics": metrics}, standard_weights_config)
+        
+        assert set(scores) == set(expected)
+        for name, fields in expected.items():
+            assert "total" in scores[name]
+            for key, value in fields.items():
+                assert scores[name][key] == value
 
 
 class TestScoreCalculatorEdgeCases:
     """Tests for edge cases in score calculation."""
 
-    def test_calculate_scores_all_zeros(self):
+    def test_calculate_scores_all_zeros(self, standard_weights_config):
         """Test handling of all zero metrics."""
-        from calculator.score_calculator import calculate_scores
-        
         raw_data = {
             "metrics": {
                 "Alice": {"items_completed": 0, "prs_authored": 0, "code_reviews": 0},
@@ -103,38 +65,20 @@ class TestScoreCalculatorEdgeCases:
             }
         }
         
-        config = {
-            "weights": {
-                "items_completed": 0.50,
-                "prs_authored": 0.30,
-                "code_reviews": 0.20
-            }
-        }
-        
-        scores = calculate_scores(raw_data, config)
+        scores = calculate_scores(raw_data, standard_weights_config)
         
         assert scores["Alice"]["total"] == 0.0
         assert scores["Bob"]["total"] == 0.0
 
-    def test_calculate_scores_single_person(self):
+    def test_calculate_scores_single_person(self, standard_weights_config):
         """Test calculation with only one person."""
-        from calculator.score_calculator import calculate_scores
-        
         raw_data = {
             "metrics": {
                 "Alice": {"items_completed": 50, "prs_authored": 30, "code_reviews": 20}
             }
         }
         
-        config = {
-            "weights": {
-                "items_completed": 0.50,
-                "prs_authored": 0.30,
-                "code_reviews": 0.20
-            }
-        }
-        
-        scores = calculate_scores(raw_data, config)
+        scores = calculate_scores(raw_data, standard_weights_config)
         
         # Single person is always "max", so all scores should be 100
         assert scores["Alice"]["items_score"] == 100.0
@@ -142,10 +86,8 @@ class TestScoreCalculatorEdgeCases:
         assert scores["Alice"]["reviews_score"] == 100.0
         assert scores["Alice"]["total"] == 100.0
 
-    def test_calculate_scores_tied_values(self):
+    def test_calculate_scores_tied_values(self, standard_weights_config):
         """Test handling of tied values."""
-        from calculator.score_calculator import calculate_scores
-        
         raw_data = {
             "metrics": {
                 "Alice": {"items_completed": 50, "prs_authored": 30, "code_reviews": 40},
@@ -153,25 +95,15 @@ class TestScoreCalculatorEdgeCases:
             }
         }
         
-        config = {
-            "weights": {
-                "items_completed": 0.50,
-                "prs_authored": 0.30,
-                "code_reviews": 0.20
-            }
-        }
-        
-        scores = calculate_scores(raw_data, config)
+        scores = calculate_scores(raw_data, standard_weights_config)
         
         # Tied values should result in equal scores
         assert scores["Alice"]["total"] == scores["Bob"]["total"]
         assert scores["Alice"]["items_score"] == 100.0
         assert scores["Bob"]["items_score"] == 100.0
 
-    def test_calculate_scores_missing_metric(self):
+    def test_calculate_scores_missing_metric(self, standard_weights_config):
         """Test handling of missing metrics in raw data."""
-        from calculator.score_calculator import calculate_scores
-        
         raw_data = {
             "metrics": {
                 "Alice": {"items_completed": 50, "prs_authored": 30},  # Missing code_reviews
@@ -179,45 +111,41 @@ class TestScoreCalculatorEdgeCases:
             }
         }
         
-        config = {
-            "weights": {
-                "items_completed": 0.50,
-                "prs_authored": 0.30,
-                "code_reviews": 0.20
-            }
-        }
-        
-        scores = calculate_scores(raw_data, config)
+        scores = calculate_scores(raw_data, standard_weights_config)
         
         # Should handle missing metric gracefully (treat as 0)
         assert scores["Alice"]["reviews_score"] == 0.0
 
-    def test_calculate_scores_empty_metrics(self):
+    def test_calculate_scores_empty_metrics(self, standard_weights_config):
         """Test handling of empty metrics dict."""
-        from calculator.score_calculator import calculate_scores
-        
         raw_data = {"metrics": {}}
         
-        config = {
-            "weights": {
-                "items_completed": 0.50,
-                "prs_authored": 0.30,
-                "code_reviews": 0.20
-            }
-        }
-        
-        scores = calculate_scores(raw_data, config)
+        scores = calculate_scores(raw_data, standard_weights_config)
         
         assert scores == {}
 
+    def test_numba_kernel_matches_numpy_path(self, monkeypatch):
+        """Test the compiled kernel gives the same floats as the NumPy path."""
+        pytest.importorskip("numba")
+        
+        rng = np.random.default_rng(7)
+        values = rng.integers(0, 60, size=(300, 3)).astype(np.float64)
+        values[:, 2] = 0  # a component with no activity scores 0
+        weights = np.array([0.5, 0.3, 0.2])
+        
+        compiled = score_calculator._score_matrix(values, weights)
+        monkeypatch.setattr(score_calculator, "NUMBA_AVAILABLE", False)
+        reference = score_calculator._score_matrix(values, weights)
+        
+        for got, expected in zip(compiled, reference):
+            np.testing.assert_array_equal(got, expected)
+
 
 class TestScoreCalculatorWeights:
     """Tests for weight handling."""
 
     def test_different_weights(self):
         """Test calculation with different weight configurations."""
-        from calculator.score_calculator import calculate_scores
-        
         raw_data = {
             "metrics": {
                 "Alice": {"items_completed": 100, "prs_authored": 0, "code_reviews": 0},
@@ -241,8 +169,6 @@ class TestScoreCalculatorWeights:
 
     def test_weights_normalized_if_not_summing_to_one(self):
         """Test that weights are normalized if they don't sum to 1."""
-        from calculator.score_calculator import calculate_scores
-        
         raw_data = {
             "metrics": {
                 "Alice": {"items_completed": 100, "prs_authored": 100, "code_reviews": 100}
@@ -263,14 +189,21 @@ class TestScoreCalculatorWeights:
         # Total should still be 100 after normalization
         assert scores["Alice"]["total"] == 100.0
 
+    def test_weight_vector_is_cached(self):
+        """Test that identical weights resolve to the same cached vector."""
+        key = tuple({"items_completed": 5, "prs_authored": 3, "code_reviews": 2}.items())
+        
+        first = _weight_vector(key)
+        
+        assert _weight_vector(key) is first
+        assert first == pytest.approx((0.5, 0.3, 0.2))
+
 
 class TestScoreCalculatorRanking:
     """Tests for ranking functionality."""
 
-    def test_rank_by_total_score(self):
+    def test_rank_by_total_score(self, standard_weights_config):
         """Test ranking team members by total score."""
-        from calculator.score_calculator import calculate_scores, rank_scores
-        
         raw_data = {
             "metrics": {
                 "Alice": {"items_completed": 50, "prs_authored": 20, "code_reviews": 30},
@@ -279,15 +212,7 @@ class TestScoreCalculatorRanking:
             }
         }
         
-        config = {
-            "weights": {
-                "items_completed": 0.50,
-                "prs_authored": 0.30,
-                "code_reviews": 0.20
-            }
-        }
-        
-        scores = calculate_scores(raw_data, config)
+        scores = calculate_scores(raw_data, standard_weights_config)
         ranked = rank_scores(scores)
         
         # Should be sorted by total score descending
@@ -298,10 +223,8 @@ class TestScoreCalculatorRanking:
         assert ranked[0]["total"] >= ranked[1]["total"]
         assert ranked[1]["total"] >= ranked[2]["total"]
 
-    def test_rank_handles_ties(self):
+    def test_rank_handles_ties(self, standard_weights_config):
         """Test ranking with tied scores."""
-        from calculator.score_calculator import calculate_scores, rank_scores
-        
         raw_data = {
             "metrics": {
                 "Alice": {"items_completed": 50, "prs_authored": 30, "code_reviews": 40},
@@ -309,69 +232,76 @@ class TestScoreCalculatorRanking:
             }
         }
         
-        config = {
-            "weights": {
-                "items_completed": 0.50,
-                "prs_authored": 0.30,
-                "code_reviews": 0.20
-            }
-        }
-        
-        scores = calculate_scores(raw_data, config)
+        scores = calculate_scores(raw_data, standard_weights_config)
         ranked = rank_scores(scores)
         
         # Both should have rank 1 for tie
         assert ranked[0]["rank"] == 1
         assert ranked[1]["rank"] == 1
 
+    def test_rank_as_records(self, scores_two_member):
+        """Test record output carries the same ranking as the dict rows."""
+        ranked = rank_scores(scores_two_member)
+        
+        records = rank_scores(scores_two_member, as_records=True)
+        
+        assert isinstance(records, np.recarray)
+        assert records.name.tolist() == [r["name"] for r in ranked]
+        assert records["rank"].tolist() == [r["rank"] for r in ranked]
+        assert records[0]["total"] == ranked[0]["total"]
+        assert records.reviews_weighted[1] == ranked[1]["reviews_weighted"]
+
+    def test_rank_as_records_empty(self):
+        """Test empty scores give an empty record array."""
+        records = rank_scores({}, as_records=True)
+        
+        assert isinstance(records, np.recarray)
+        assert len(records) == 0
+
+    @pytest.mark.parametrize("metrics", [
+        {},
+        {
+            "Alice": {"items_completed": 50, "prs_authored": 20, "code_reviews": 30},
+            "Bob": {"items_completed": 30, "prs_authored": 40, "code_reviews": 20},
+            "Carol": {"items_completed": 50, "prs_authored": 20, "code_reviews": 30}
+        },
+    ], ids=["empty", "with_tie"])
+    def test_calculate_and_rank_matches_two_step(self, standard_weights_config, metrics):
+        """Test the fused path equals rank_scores(calculate_scores(...))."""
+        raw_data = {"metrics": metrics}
+        
+        fused = calculate_and_rank(raw_data, standard_weights_config)
+        
+        assert fused == rank_scores(calculate_scores(raw_data, standard_weights_config))
+
 
 class TestScoreCalculatorOutput:
     """Tests for score output formatting."""
 
-    def test_scores_include_component_breakdown(self):
+    def test_scores_include_component_breakdown(self, standard_weights_config):
         """Test that scores include component breakdown."""
-        from calculator.score_calculator import calculate_scores
-        
         raw_data = {
             "metrics": {
                 "Alice": {"items_completed": 50, "prs_authored": 20, "code_reviews": 30}
             }
         }
         
-        config = {
-            "weights": {
-                "items_completed": 0.50,
-                "prs_authored": 0.30,
-                "code_reviews": 0.20
-            }
-        }
-        
-        scores = calculate_scores(raw_data, config)
+        scores = calculate_scores(raw_data, standard_weights_config)
         
         assert "items_score" in scores["Alice"]
         assert "prs_score" in scores["Alice"]
         assert "reviews_score" in scores["Alice"]
         assert "total" in scores["Alice"]
 
-    def test_scores_include_weighted_contribution(self):
+    def test_scores_include_weighted_contribution(self, standard_weights_config):
         """Test that scores include weighted contribution values."""
-        from calculator.score_calculator import calculate_scores
-        
         raw_data = {
             "metrics": {
                 "Alice": {"items_completed": 100, "prs_authored": 100, "code_reviews": 100}
             }
         }
         
-        config = {
-            "weights": {
-                "items_completed": 0.50,
-                "prs_authored": 0.30,
-                "code_reviews": 0.20
-            }
-        }
-        
-        scores = calculate_scores(raw_data, config)
+        scores = calculate_scores(raw_data, standard_weights_config)
         
         # Should include weighted contributions
         assert "items_weighted" in scores["Alice"]
@@ -379,14 +309,28 @@ class TestScoreCalculatorOutput:
         assert scores["Alice"]["prs_weighted"] == 30.0  # 100 * 0.30
         assert scores["Alice"]["reviews_weighted"] == 20.0  # 100 * 0.20
 
+    def test_scores_match_python_float_math(self, standard_weights_config):
+        """Test scores are exactly what scalar float arithmetic gives."""
+        raw_data = {
+            "metrics": {
+                "Alice": {"items_completed": 3, "prs_authored": 7, "code_reviews": 9},
+                "Bob": {"items_completed": 1, "prs_authored": 3, "code_reviews": 7}
+            }
+        }
+        
+        bob = calculate_scores(raw_data, standard_weights_config)["Bob"]
+        
+        assert score_calculator.SCORE_DTYPE == np.float64
+        assert bob["items_score"] == 1 / 3 * 100
+        assert bob["prs_weighted"] == 3 / 7 * 100 * 0.3
+        assert bob["total"] == 1 / 3 * 100 * 0.5 + 3 / 7 * 100 * 0.3 + 7 / 9 * 100 * 0.2
+
 
 class TestComponentContributions:
     """Tests for calculate_component_contributions function."""
     
     def test_component_contributions_basic(self):
         """Test basic component contribution calculation."""
-        from calculator.score_calculator import calculate_component_contributions
-        
         scores = {
             "Alice": {
                 "items_weighted": 50.0,
@@ -404,8 +348,6 @@ class TestComponentContributions:
     
     def test_component_contributions_zero_total(self):
         """Test contributions when total is zero."""
-        from calculator.score_calculator import calculate_component_contributions
-        
         scores = {
             "Alice": {
                 "items_weighted": 0.0,
@@ -423,8 +365,6 @@ class TestComponentContributions:
     
     def test_component_contributions_multiple_members(self):
         """Test contributions for multiple team members."""
-        from calculator.score_calculator import calculate_component_contributions
-        
         scores = {
             "Alice": {
                 "items_weighted": 40.0,
@@ -448,14 +388,25 @@ class TestComponentContributions:
         # Bob: 20/60 = 33.33%
         assert abs(result["Bob"]["reviews_pct"] - 33.33) < 0.1
 
+    def test_component_contributions_cached_result_not_shared(self):
+        """Test repeated calls hit the cache but return independent dicts."""
+        scores = {"Alice": {"items_weighted": 10.0, "prs_weighted": 6.0,
+                            "reviews_weighted": 4.0, "total": 20.0}}
+        
+        first = calculate_component_contributions(scores)
+        hits = _contribution_rows.cache_info().hits
+        first["Alice"]["items_pct"] = -1.0
+        second = calculate_component_contributions(scores)
+        
+        assert _contribution_rows.cache_info().hits == hits + 1
+        assert second == {"Alice": {"items_pct": 50.0, "prs_pct": 30.0, "reviews_pct": 20.0}}
+
 
 class TestComparePeriods:
     """Tests for compare_periods function."""
     
     def test_compare_periods_basic(self):
         """Test basic period comparison."""
-        from calculator.score_calculator import compare_periods
-        
         current = {
             "Alice": {"total": 85.0},
             "Bob": {"total": 70.0}
@@ -478,8 +429,6 @@ class TestComparePeriods:
     
     def test_compare_periods_stable(self):
         """Test comparison with stable (minimal change)."""
-        from calculator.score_calculator import compare_periods
-        
         current = {"Alice": {"total": 80.0}}
         previous = {"Alice": {"total": 80.3}}
         
@@ -489,8 +438,6 @@ class TestComparePeriods:
     
     def test_compare_periods_new_member(self):
         """Test comparison when member is new (not in previous)."""
-        from calculator.score_calculator import compare_periods
-        
         current = {
             "Alice": {"total": 85.0},
             "NewGuy": {"total": 60.0}
@@ -509,8 +456,6 @@ class TestComparePeriods:
     
     def test_compare_periods_left_member(self):
         """Test comparison when member left (not in current)."""
-        from calculator.score_calculator import compare_periods
-        
         current = {"Alice": {"total": 85.0}}
         previous = {
             "Alice": {"total": 80.0},
@@ -523,3 +468,28 @@ class TestComparePeriods:
         assert result["LeftGuy"]["current"] == 0
         assert result["LeftGuy"]["previous"] == 70.0
         assert result["LeftGuy"]["trend"] == "down"
+
+
+class TestSummarizeByTeam:
+    """Tests for summarize_by_team function."""
+
+    def test_summarize_by_team(self):
+        """Test totals, counts and averages per team."""
+        scores = {
+            "Alice": {"total": 90.0},
+            "Bob": {"total": 60.0},
+            "Carol": {"total": 45.0},
+            "Dave": {"total": 30.0}
+        }
+        team_map = {"Alice": "Platform", "Bob": "Apps", "Carol": "Platform"}
+        
+        result = summarize_by_team(scores, team_map)
+        
+        assert list(result) == ["Apps", "Platform", score_calculator.UNASSIGNED_TEAM]
+        assert result["Platform"] == {"members": 2, "total": 135.0, "average": 67.5}
+        assert result["Apps"] == {"members": 1, "total": 60.0, "average": 60.0}
+        assert result[score_calculator.UNASSIGNED_TEAM]["total"] == 30.0
+
+    def test_summarize_by_team_empty(self):
+        """Test empty scores give an empty summary."""
+        assert summarize_by_team({}, {"Alice": "Platform"}) == {}
@@ -1,10 +1,13 @@
 """Tests for the tables display module."""
+import re
+
 import pytest
-from pathlib import Path
 from io import StringIO
-import sys
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from display.tables import (
+    create_ranking_table, create_markdown_table, print_ranking_table,
+    create_summary_table, _ranking_layout, _render_ranking_table
+)
 
 
 class TestRankingTable:
@@ -12,8 +15,6 @@ class TestRankingTable:
 
     def test_create_ranking_table_basic(self):
         """Test creating a basic ranking table."""
-        from display.tables import create_ranking_table
-        
         ranked_data = [
             {"rank": 1, "name": "Alice", "total": 95.0, "items_weighted": 50.0, "prs_weighted": 25.0, "reviews_weighted": 20.0},
             {"rank": 2, "name": "Bob", "total": 85.0, "items_weighted": 40.0, "prs_weighted": 30.0, "reviews_weighted": 15.0}
@@ -28,8 +29,6 @@ class TestRankingTable:
 
     def test_ranking_table_has_headers(self):
         """Test that table has proper headers."""
-        from display.tables import create_ranking_table
-        
         ranked_data = [
             {"rank": 1, "name": "Alice", "total": 95.0, "items_weighted": 50.0, "prs_weighted": 25.0, "reviews_weighted": 20.0}
         ]
@@ -42,16 +41,12 @@ class TestRankingTable:
 
     def test_ranking_table_empty_data(self):
         """Test table with empty data."""
-        from display.tables import create_ranking_table
-        
         table = create_ranking_table([])
         
         assert table == "" or "No data" in table
 
     def test_ranking_table_sorted_by_rank(self):
         """Test that table maintains rank order."""
-        from display.tables import create_ranking_table
-        
         ranked_data = [
             {"rank": 1, "name": "Alice", "total": 95.0, "items_weighted": 50.0, "prs_weighted": 25.0, "reviews_weighted": 20.0},
             {"rank": 2, "name": "Bob", "total": 85.0, "items_weighted": 40.0, "prs_weighted": 30.0, "reviews_weighted": 15.0},
@@ -61,11 +56,22 @@ class TestRankingTable:
         table = create_ranking_table(ranked_data)
         
         # Alice should appear before Bob, Bob before Carol
-        alice_pos = table.find("Alice")
-        bob_pos = table.find("Bob")
-        carol_pos = table.find("Carol")
+        positions = {m.group(): m.start() for m in re.finditer(r"Alice|Bob|Carol", table)}
+        
+        assert positions["Alice"] < positions["Bob"] < positions["Carol"]
+
+    def test_ranking_table_render_is_cached(self):
+        """Test identical rows are rendered once and served from the cache."""
+        ranked_data = [
+            {"rank": 1, "name": "Alice", "total": 95.0, "items_weighted": 50.0, "prs_weighted": 25.0, "reviews_weighted": 20.0}
+        ]
         
-        assert alice_pos < bob_pos < carol_pos
+        first = create_ranking_table(ranked_data, precision=2)
+        hits = _render_ranking_table.cache_info().hits
+        second = create_ranking_table([dict(ranked_data[0])], precision=2)
+        
+        assert second == first
+        assert _render_ranking_table.cache_info().hits == hits + 1
 
 
 class TestMarkdownTable:
@@ -73,8 +79,6 @@ class TestMarkdownTable:
 
     def test_create_markdown_table(self):
         """Test creating a markdown format table."""
-        from display.tables import create_markdown_table
-        
         ranked_data = [
             {"rank": 1, "name": "Alice", "total": 95.0, "items_weighted": 50.0, "prs_weighted": 25.0, "reviews_weighted": 20.0}
         ]
@@ -86,8 +90,6 @@ class TestMarkdownTable:
 
     def test_markdown_table_proper_format(self):
         """Test markdown table has proper format for rendering."""
-        from display.tables import create_markdown_table
-        
         ranked_data = [
             {"rank": 1, "name": "Alice", "total": 95.0, "items_weighted": 50.0, "prs_weighted": 25.0, "reviews_weighted": 20.0}
         ]
@@ -104,8 +106,6 @@ class TestTableFormatting:
 
     def test_table_with_decimal_precision(self):
         """Test table respects decimal precision."""
-        from display.tables import create_ranking_table
-        
         ranked_data = [
             {"rank": 1, "name": "Alice", "total": 95.123456, "items_weighted": 50.0, "prs_weighted": 25.0, "reviews_weighted": 20.0}
         ]
@@ -115,10 +115,21 @@ class TestTableFormatting:
         # Should show 95.1, not 95.123456
         assert "95.1" in table or "95.12" in table
 
+    def test_negative_zero_renders_as_zero(self):
+        """Test -0.0 scores print as 0.0, same as the equal 0.0 rows they share a cache entry with."""
+        ranked_data = [
+            {"rank": 1, "name": "Alice", "total": -0.0, "items_weighted": -0.0, "prs_weighted": 0.0, "reviews_weighted": 0.0}
+        ]
+        
+        table = create_ranking_table(ranked_data)
+        markdown = create_markdown_table(ranked_data)
+        
+        assert "-0.0" not in table
+        assert "-0.0" not in markdown
+        assert "**0.0**" in markdown
+
     def test_table_alignment(self):
         """Test that table columns are properly aligned."""
-        from display.tables import create_ranking_table
-        
         ranked_data = [
             {"rank": 1, "name": "Alice", "total": 95.0, "items_weighted": 50.0, "prs_weighted": 25.0, "reviews_weighted": 20.0},
             {"rank": 10, "name": "Bob", "total": 5.0, "items_weighted": 2.0, "prs_weighted": 2.0, "reviews_weighted": 1.0}
@@ -136,8 +147,6 @@ class TestTablePrinting:
 
     def test_print_table_to_stdout(self, capsys):
         """Test printing table to stdout."""
-        from display.tables import print_ranking_table
-        
         ranked_data = [
             {"rank": 1, "name": "Alice", "total": 95.0, "items_weighted": 50.0, "prs_weighted": 25.0, "reviews_weighted": 20.0}
         ]
@@ -149,8 +158,6 @@ class TestTablePrinting:
 
     def test_print_table_with_title(self, capsys):
         """Test printing table with title."""
-        from display.tables import print_ranking_table
-        
         ranked_data = [
             {"rank": 1, "name": "Alice", "total": 95.0, "items_weighted": 50.0, "prs_weighted": 25.0, "reviews_weighted": 20.0}
         ]
@@ -160,14 +167,28 @@ class TestTablePrinting:
         captured = capsys.readouterr()
         assert "Sprint Q1-S2" in captured.out or "Rankings" in captured.out
 
+    def test_repeated_prints_reuse_layout(self, capsys):
+        """Test tables with the same name width share one cached layout."""
+        ranked_data = [
+            {"rank": 1, "name": "Alice", "total": 95.0, "items_weighted": 50.0, "prs_weighted": 25.0, "reviews_weighted": 20.0}
+        ]
+        renamed = [{**ranked_data[0], "name": "Brian"}]
+        
+        print_ranking_table(ranked_data, precision=3)
+        hits = _ranking_layout.cache_info().hits
+        print_ranking_table(renamed, precision=3)
+        
+        assert _ranking_layout.cache_info().hits == hits + 1
+        out_lines = capsys.readouterr().out.splitlines()
+        assert out_lines[0] == out_lines[3]  # same header
+        assert "Brian" in out_lines[-1] and "95.000" in out_lines[-1]
+
 
 class TestSummaryTable:
     """Tests for summary statistics table."""
 
     def test_create_summary_table(self):
         """Test creating a summary statistics table."""
-        from display.tables import create_summary_table
-        
         raw_data = {
             "metrics": {
                 "Alice": {"items_completed": 50, "prs_authored": 20, "code_reviews": 30},
@@ -182,8 +203,6 @@ class TestSummaryTable:
 
     def test_summary_table_shows_totals(self):
         """Test that summary shows team totals."""
-        from display.tables import create_summary_table
-        
         raw_data = {
             "metrics": {
                 "Alice": {"items_completed": 50, "prs_authored": 20, "code_reviews": 30},
@@ -18,10 +18,18 @@ import argparse
 import json
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
+from typing import Optional
 
 try:
+    import matplotlib
+    # Export-only runs never open a window; skip GUI backend startup
+    if __name__ == "__main__" and any(arg.startswith(("--export", "--no-show")) for arg in sys.argv[1:]):
+        matplotlib.use("Agg")
     import matplotlib.pyplot as plt
     import matplotlib.dates as mdates
     import numpy as np
@@ -30,6 +38,18 @@ except ImportError:
     print("   pip install matplotlib numpy")
     sys.exit(1)
 
+# Optional faster JSON parser for large data files
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Data files above this size print a hint to install orjson
+ORJSON_HINT_BYTES = 1024 * 1024
+
 # Configuration
 SCRIPT_DIR = Path(__file__).parent
 DATA_DIR = SCRIPT_DIR / "data"
@@ -42,6 +62,20 @@ DEFAULT_COLORS = [
     "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf"
 ]
 
+# Periods present in every data file, in display order
+PERIODS = ("last_month", "last_3_months", "h2_2025", "full_2025")
+
+# Chart title for each period
+PERIOD_LABELS = {
+    "last_month": "Last Month",
+    "last_3_months": "Last 3 Months",
+    "h2_2025": "H2 2025 (Jun-Dec)",
+    "full_2025": "Full Year 2025"
+}
+
+# Compact legend labels for the comparison chart, aligned with PERIODS
+PERIOD_SHORT_LABELS = ("Last Month", "Last 3 Mo", "H2 2025", "Full 2025")
+
 
 def load_team_config() -> tuple[dict, dict, str]:
     """
@@ -87,8 +121,34 @@ def load_team_config() -> tuple[dict, dict, str]:
     return team_members, colors, team_name
 
 
-# Load configuration at module level
-TEAM_MEMBERS, COLORS, TEAM_NAME = load_team_config()
+# Team configuration names, resolved from team_config.json on first use so
+# importing the module (or running --help) never touches the config file
+_CONFIG_NAMES = ("TEAM_MEMBERS", "COLORS", "TEAM_NAME", "USERNAME_INDEX", "COLOR_ARRAY")
+
+# Chart color for reviewers missing from the team config
+FALLBACK_COLOR = "#333333"
+
+
+@lru_cache(maxsize=1)
+def _config() -> dict:
+    """Team configuration keyed by _CONFIG_NAMES, loaded once."""
+    team_members, colors, team_name = load_team_config()
+    return {
+        "TEAM_MEMBERS": team_members,
+        "COLORS": colors,
+        "TEAM_NAME": team_name,
+        # Username -> row of COLOR_ARRAY; the extra last row holds the
+        # fallback color, so unknown usernames map to index -1
+        "USERNAME_INDEX": {username: i for i, username in enumerate(colors)},
+        "COLOR_ARRAY": np.array([*colors.values(), FALLBACK_COLOR]),
+    }
+
+
+def __getattr__(name: str):
+    """Resolve the team configuration names lazily (PEP 562)."""
+    if name in _CONFIG_NAMES:
+        return _config()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def fetch_fresh_data():
@@ -115,71 +175,221 @@ def get_count(review: dict, period: str) -> int:
     Old format: {"full_2025": 100}
     New format: {"full_2025": {"count": 100, "prs": [...]}}
     """
-    value = review.get(period, 0)
+    value = review.get(period)
+    # Old-format ints are the common case, so they are checked first
+    if isinstance(value, int):
+        return value
     if isinstance(value, dict):
         return value.get("count", 0)
-    elif isinstance(value, int):
-        return value
     return 0
 
 
 def get_prs(review: dict, period: str) -> list:
     """Get PR list from review data (new format only)."""
-    value = review.get(period, {})
-    if isinstance(value, dict):
-        return value.get("prs", [])
-    return []
+    value = review.get(period)
+    return value.get("prs", []) if isinstance(value, dict) else []
+
+
+@lru_cache(maxsize=4)
+def _load_data_cached(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a data file; mtime and size are cache-key only, so edits miss."""
+    with open(path, "rb") as f:
+        return _loads(f.read())
+
+
+def _build_matrix(reviews: list) -> tuple[list[str], list[str], np.ndarray]:
+    """
+    Collect every review's name, chart color and per-period counts in one pass.
+    
+    Returns:
+        tuple: (display names, colors, counts) where counts[i, j] is
+            reviews[i]'s count for PERIODS[j]
+    """
+    username_index = _config()["USERNAME_INDEX"]
+    names, color_idx, flat = [], [], []
+    for r in reviews:
+        names.append(r["display_name"])
+        color_idx.append(username_index.get(r.get("github_username", ""), -1))
+        flat += [get_count(r, period) for period in PERIODS]
+    counts = np.array(flat, dtype=np.int32).reshape(len(reviews), len(PERIODS))
+    colors = _config()["COLOR_ARRAY"][color_idx].tolist() if color_idx else []
+    return names, colors, counts
+
+
+def _period_counts(reviews: list, counts: np.ndarray, period: str) -> np.ndarray:
+    """Column of counts for one period, read per review if it is not in PERIODS."""
+    if period in PERIODS:
+        return counts[:, PERIODS.index(period)]
+    return np.array([get_count(r, period) for r in reviews], dtype=np.int32)
 
 
 def load_data():
-    """Load the latest data file."""
-    if not LATEST_DATA.exists():
+    """
+    Load the latest data file.
+    
+    Parsed data is cached per (path, mtime, size), so repeated loads of an
+    unchanged file skip JSON parsing. Callers share the cached dict and must
+    not modify it.
+    """
+    try:
+        st = LATEST_DATA.stat()
+    except FileNotFoundError:
         print(f"❌ No data file found at {LATEST_DATA}")
         print("   Run: ./fetch_code_reviews.sh first")
         return None
     
-    with open(LATEST_DATA) as f:
-        return json.load(f)
+    if not ORJSON_AVAILABLE and st.st_size > ORJSON_HINT_BYTES:
+        print("💡 Tip: pip install orjson for faster loading of large data files")
+    
+    return _load_data_cached(str(LATEST_DATA), st.st_mtime_ns, st.st_size)
+
+
+def _fetch_one(username: str, display_name: str, start_date: str, end_date: str) -> tuple[str, dict, str]:
+    """
+    Fetch one team member's reviewed PRs for a date range.
+    
+    Returns:
+        tuple: (username, result entry, status message for the progress line)
+    """
+    empty = {"display_name": display_name, "count": 0, "prs": []}
+    try:
+        cmd = [
+            "gh", "search", "prs",
+            f"--reviewed-by={username}",
+            f"--created={start_date}..{end_date}",
+            "--limit=500",
+            "--json", "number,title,repository,createdAt,closedAt"
+        ]
+        # Raw bytes straight into the parser; no intermediate str decode
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=60)
+        
+        if result.returncode == 0:
+            prs = _loads(result.stdout)
+            entry = {
+                "display_name": display_name,
+                "count": len(prs),
+                "prs": prs
+            }
+            return username, entry, f"{len(prs)} reviews"
+        return username, empty, f"error: {result.stderr.decode(errors='replace').strip()}"
+    except Exception as e:
+        return username, empty, f"error: {e}"
+
+
+# Fields requested per PR; mirrors the gh search prs --json field list
+_GRAPHQL_PR_FIELDS = "number title createdAt closedAt repository { name nameWithOwner }"
+
+
+def _fetch_all_graphql(start_date: str, end_date: str) -> Optional[dict]:
+    """
+    Fetch every team member's reviewed PRs with aliased GraphQL queries.
+    
+    Each member gets a ``uN`` alias in TEAM_MEMBERS order, so one ``gh``
+    process and one round trip cover the whole team's first page. Search
+    pages hold at most 100 nodes; members with more are paged with
+    ``after:`` cursors, again batched into one query per round, until every
+    ``prs`` list is complete.
+    
+    Returns:
+        dict: Same shape as fetch_detailed_data, or None if any call fails
+    """
+    members = list(_config()["TEAM_MEMBERS"].items())
+    queries = {
+        f"u{i}": json.dumps(f"is:pr reviewed-by:{username} created:{start_date}..{end_date}")
+        for i, (username, _) in enumerate(members)
+    }
+    counts, nodes = {}, {alias: [] for alias in queries}
+    # Alias -> cursor of the next page to request (None for the first page)
+    cursors = dict.fromkeys(queries)
+    try:
+        while cursors:
+            searches = " ".join(
+                f"{alias}: search(query: {queries[alias]}, type: ISSUE, first: 100"
+                f"{f', after: {json.dumps(cursor)}' if cursor else ''}) "
+                f"{{ issueCount pageInfo {{ hasNextPage endCursor }} "
+                f"nodes {{ ... on PullRequest {{ {_GRAPHQL_PR_FIELDS} }} }} }}"
+                for alias, cursor in cursors.items()
+            )
+            result = subprocess.run(
+                ["gh", "api", "graphql", "-f", f"query=query {{ {searches} }}"],
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=120
+            )
+            if result.returncode != 0:
+                print(f"   ⚠️ GraphQL search failed: {result.stderr.decode(errors='replace').strip()}")
+                return None
+            data = _loads(result.stdout)["data"]
+            cursors = {}
+            for alias, page in data.items():
+                counts[alias] = page["issueCount"]
+                nodes[alias] += page["nodes"]
+                if page["pageInfo"]["hasNextPage"]:
+                    cursors[alias] = page["pageInfo"]["endCursor"]
+        return {
+            username: {
+                "display_name": display_name,
+                "count": counts[f"u{i}"],
+                "prs": nodes[f"u{i}"]
+            }
+            for i, (username, display_name) in enumerate(members)
+        }
+    except Exception:
+        return None
 
 
 def fetch_detailed_data(start_date: str, end_date: str) -> dict:
     """Fetch detailed PR review data for a custom date range."""
     print(f"🔍 Fetching detailed data from {start_date} to {end_date}...")
-    
+    team_members = _config()["TEAM_MEMBERS"]
+    
+    results = _fetch_all_graphql(start_date, end_date) if team_members else {}
+    if results is not None:
+        for entry in results.values():
+            print(f"   📊 {entry['display_name']}... {entry['count']} reviews")
+            if len(entry["prs"]) < entry["count"]:
+                # GitHub search stops returning results after 1000 hits
+                print(f"   ⚠️ Only {len(entry['prs'])} of {entry['count']} PRs returned by search")
+        return results
+    
+    # GraphQL unavailable: one gh call per member, run concurrently since each
+    # is network-bound; map() yields in TEAM_MEMBERS order so output is stable
     results = {}
-    for username, display_name in TEAM_MEMBERS.items():
-        print(f"   📊 {display_name}...", end=" ", flush=True)
-        
-        try:
-            cmd = [
-                "gh", "search", "prs",
-                f"--reviewed-by={username}",
-                f"--created={start_date}..{end_date}",
-                "--limit=500",
-                "--json", "number,title,repository,createdAt,closedAt"
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-            
-            if result.returncode == 0:
-                prs = json.loads(result.stdout)
-                results[username] = {
-                    "display_name": display_name,
-                    "count": len(prs),
-                    "prs": prs
-                }
-                print(f"{len(prs)} reviews")
-            else:
-                results[username] = {"display_name": display_name, "count": 0, "prs": []}
-                print("0 reviews")
-        except Exception as e:
-            print(f"error: {e}")
-            results[username] = {"display_name": display_name, "count": 0, "prs": []}
+    with ThreadPoolExecutor(max_workers=max(1, min(16, len(team_members)))) as ex:
+        fetched = ex.map(
+            lambda member: _fetch_one(*member, start_date, end_date),
+            team_members.items()
+        )
+        for username, entry, status in fetched:
+            print(f"   📊 {entry['display_name']}... {status}")
+            results[username] = entry
     
     return results
 
 
-def plot_bar_chart(data: dict, period: str = "full_2025", save_path: str = None):
-    """Create a bar chart for code reviews by team member."""
+def _finish_figure(fig, save_path: str = None):
+    """Lay out a finished figure, then save it (or show it) and close it."""
+    fig.tight_layout()
+    
+    if save_path:
+        # Render in memory, then write the file in one call
+        buf = BytesIO()
+        fig.savefig(buf, format=Path(save_path).suffix.lstrip(".") or "png", dpi=150, bbox_inches='tight')
+        Path(save_path).write_bytes(buf.getvalue())
+        print(f"📊 Saved: {save_path}")
+    else:
+        plt.show()
+    
+    plt.close()
+
+
+def plot_bar_chart(data: dict, period: str = "full_2025", save_path: str = None, matrix: tuple = None,
+                   ax=None):
+    """
+    Create a bar chart for code reviews by team member.
+    
+    matrix is an optional prebuilt _build_matrix(data["reviews"]) result.
+    When ax is given the chart is drawn onto it and the caller owns its
+    figure; save_path is then ignored.
+    """
     if data is None:
         print("⚠️ No data to display")
         return
@@ -190,15 +400,18 @@ def plot_bar_chart(data: dict, period: str = "full_2025", save_path: str = None)
         print("⚠️ No reviews data to display")
         return
     
-    names = [r["display_name"] for r in reviews]
-    counts = [get_count(r, period) for r in reviews]
-    colors = [COLORS.get(r.get("github_username", ""), "#333333") for r in reviews]
+    names, colors, counts = matrix if matrix is not None else _build_matrix(reviews)
+    counts = _period_counts(reviews, counts, period)
     
-    # Sort by count descending
-    sorted_data = sorted(zip(names, counts, colors), key=lambda x: x[1], reverse=True)
-    names, counts, colors = zip(*sorted_data)
+    # Sort by count descending; stable so ties keep their data-file order
+    order = np.argsort(-counts, kind="stable")
+    counts = counts[order]
+    names = [names[i] for i in order]
+    colors = [colors[i] for i in order]
     
-    fig, ax = plt.subplots(figsize=(12, 6))
+    own_figure = ax is None
+    if own_figure:
+        fig, ax = plt.subplots(figsize=(12, 6))
     bars = ax.bar(names, counts, color=colors, edgecolor='black', linewidth=0.5)
     
     # Add value labels on bars
@@ -210,65 +423,72 @@ def plot_bar_chart(data: dict, period: str = "full_2025", save_path: str = None)
                     textcoords="offset points",
                     ha='center', va='bottom', fontsize=12, fontweight='bold')
     
-    period_labels = {
-        "last_month": "Last Month",
-        "last_3_months": "Last 3 Months",
-        "h2_2025": "H2 2025 (Jun-Dec)",
-        "full_2025": "Full Year 2025"
-    }
-    
     ax.set_xlabel('Team Member', fontsize=12)
     ax.set_ylabel('Number of Code Reviews', fontsize=12)
-    ax.set_title(f'Code Reviews by Team Member - {period_labels.get(period, period)}', fontsize=14, fontweight='bold')
+    ax.set_title(f'Code Reviews by Team Member - {PERIOD_LABELS.get(period, period)}', fontsize=14, fontweight='bold')
     ax.set_xticklabels(names, rotation=15, ha='right')
     
     # Add total
-    total = sum(counts)
+    total = int(counts.sum())
     ax.text(0.98, 0.98, f'Total: {total}', transform=ax.transAxes, 
             ha='right', va='top', fontsize=11, 
             bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
     
-    plt.tight_layout()
-    
-    if save_path:
-        plt.savefig(save_path, dpi=150, bbox_inches='tight')
-        print(f"📊 Saved: {save_path}")
-    else:
-        plt.show()
-    
-    plt.close()
+    if own_figure:
+        _finish_figure(fig, save_path)
+
 
+@lru_cache(maxsize=None)
+def _explode(n: int) -> tuple:
+    """Uniform wedge offsets for an n-slice pie; one shared tuple per size."""
+    return (0.02,) * n
 
-def plot_pie_chart(data: dict, period: str = "full_2025", save_path: str = None):
-    """Create a pie chart showing distribution of code reviews."""
+
+def plot_pie_chart(data: dict, period: str = "full_2025", save_path: str = None, matrix: tuple = None,
+                   ax=None):
+    """
+    Create a pie chart showing distribution of code reviews.
+    
+    matrix is an optional prebuilt _build_matrix(data["reviews"]) result.
+    When ax is given the chart is drawn onto it and the caller owns its
+    figure; save_path is then ignored.
+    """
     if data is None:
         print("⚠️ No data to display")
         return
     
     reviews = data.get("reviews", [])
     
-    names = [r["display_name"] for r in reviews]
-    counts = [get_count(r, period) for r in reviews]
-    colors = [COLORS.get(r.get("github_username", ""), "#333333") for r in reviews]
+    names, colors, counts = matrix if matrix is not None else _build_matrix(reviews)
+    counts = _period_counts(reviews, counts, period)
     
     # Filter out zeros
-    filtered = [(n, c, col) for n, c, col in zip(names, counts, colors) if c > 0]
-    if not filtered:
+    keep = np.flatnonzero(counts > 0)
+    if not keep.size:
         print("⚠️ No data to display")
         return
     
-    names, counts, colors = zip(*filtered)
-    total = sum(counts)
+    counts = counts[keep]
+    names = [names[i] for i in keep]
+    colors = [colors[i] for i in keep]
+    total = int(counts.sum())
+    
+    own_figure = ax is None
+    if own_figure:
+        fig, ax = plt.subplots(figsize=(10, 8))
     
-    fig, ax = plt.subplots(figsize=(10, 8))
+    # Wedge label: percentage plus review count. total is bound as a default
+    # so each per-wedge call reads a fast local instead of a closure cell.
+    def _autopct(pct, _total=total):
+        return f'{pct:.1f}%\n({int(pct / 100 * _total)})'
     
     wedges, texts, autotexts = ax.pie(
         counts,
         labels=names,
         colors=colors,
-        autopct=lambda pct: f'{pct:.1f}%\n({int(pct/100*total)})',
+        autopct=_autopct,
         startangle=90,
-        explode=[0.02] * len(counts),
+        explode=_explode(len(counts)),
         shadow=True
     )
     
@@ -276,29 +496,21 @@ def plot_pie_chart(data: dict, period: str = "full_2025", save_path: str = None)
         autotext.set_fontsize(9)
         autotext.set_fontweight('bold')
     
-    period_labels = {
-        "last_month": "Last Month",
-        "last_3_months": "Last 3 Months",
-        "h2_2025": "H2 2025 (Jun-Dec)",
-        "full_2025": "Full Year 2025"
-    }
-    
-    ax.set_title(f'Code Review Distribution - {period_labels.get(period, period)}\n(Total: {total})', 
+    ax.set_title(f'Code Review Distribution - {PERIOD_LABELS.get(period, period)}\n(Total: {total})', 
                  fontsize=14, fontweight='bold')
     
-    plt.tight_layout()
-    
-    if save_path:
-        plt.savefig(save_path, dpi=150, bbox_inches='tight')
-        print(f"📊 Saved: {save_path}")
-    else:
-        plt.show()
-    
-    plt.close()
+    if own_figure:
+        _finish_figure(fig, save_path)
 
 
-def plot_comparison(data: dict, save_path: str = None):
-    """Create a grouped bar chart comparing all periods."""
+def plot_comparison(data: dict, save_path: str = None, matrix: tuple = None, ax=None):
+    """
+    Create a grouped bar chart comparing all periods.
+    
+    matrix is an optional prebuilt _build_matrix(data["reviews"]) result.
+    When ax is given the chart is drawn onto it and the caller owns its
+    figure; save_path is then ignored.
+    """
     if data is None:
         print("⚠️ No data to display")
         return
@@ -309,18 +521,18 @@ def plot_comparison(data: dict, save_path: str = None):
         print("⚠️ No reviews data to display")
         return
     
-    periods = ["last_month", "last_3_months", "h2_2025", "full_2025"]
-    period_labels = ["Last Month", "Last 3 Mo", "H2 2025", "Full 2025"]
-    
-    names = [r["display_name"].split()[0] for r in reviews]  # First name only
+    names, _, matrix_counts = matrix if matrix is not None else _build_matrix(reviews)
+    names = [name.split()[0] for name in names]  # First name only
     
     x = np.arange(len(names))
     width = 0.2
     
-    fig, ax = plt.subplots(figsize=(14, 7))
+    own_figure = ax is None
+    if own_figure:
+        fig, ax = plt.subplots(figsize=(14, 7))
     
-    for i, (period, label) in enumerate(zip(periods, period_labels)):
-        counts = [get_count(r, period) for r in reviews]
+    for i, label in enumerate(PERIOD_SHORT_LABELS):
+        counts = matrix_counts[:, i]
         offset = (i - 1.5) * width
         bars = ax.bar(x + offset, counts, width, label=label, alpha=0.8)
         
@@ -341,56 +553,54 @@ def plot_comparison(data: dict, save_path: str = None):
     ax.legend(loc='upper right')
     ax.grid(axis='y', alpha=0.3)
     
-    plt.tight_layout()
-    
-    if save_path:
-        plt.savefig(save_path, dpi=150, bbox_inches='tight')
-        print(f"📊 Saved: {save_path}")
-    else:
-        plt.show()
-    
-    plt.close()
+    if own_figure:
+        _finish_figure(fig, save_path)
 
 
-def print_summary_table(data: dict):
-    """Print a summary table to console."""
+def print_summary_table(data: dict, matrix: tuple = None):
+    """
+    Print a summary table to console.
+    
+    matrix is an optional prebuilt _build_matrix(data["reviews"]) result.
+    """
     if data is None:
         print("⚠️ No data to display")
         return
     
     reviews = data.get("reviews", [])
     
-    print("\n" + "="*80)
-    print(f"CODE REVIEW STATISTICS - {TEAM_NAME.upper()}")
-    print("="*80)
-    print(f"Generated: {data.get('generated_at', 'Unknown')}")
-    print("-"*80)
-    print(f"{'Team Member':<22} {'Last Month':>12} {'Last 3 Mo':>12} {'H2 2025':>10} {'Full 2025':>11}")
-    print("-"*80)
+    names, _, counts = matrix if matrix is not None else _build_matrix(reviews)
+    
+    # Collect the whole table and write it once instead of print() per line
+    lines = [
+        "",
+        "="*80,
+        f"CODE REVIEW STATISTICS - {_config()['TEAM_NAME'].upper()}",
+        "="*80,
+        f"Generated: {data.get('generated_at', 'Unknown')}",
+        "-"*80,
+        f"{'Team Member':<22} {'Last Month':>12} {'Last 3 Mo':>12} {'H2 2025':>10} {'Full 2025':>11}",
+        "-"*80,
+    ]
+    
+    lines.extend(
+        f"{name:<22} {lm:>12} {l3m:>12} {h2:>10} {full:>11}"
+        for name, (lm, l3m, h2, full) in zip(names, counts.tolist())
+    )
     
-    totals = {"last_month": 0, "last_3_months": 0, "h2_2025": 0, "full_2025": 0}
+    lm, l3m, h2, full = counts.sum(axis=0).tolist()
+    lines.append("-"*80)
+    lines.append(f"{'TOTAL':<22} {lm:>12} {l3m:>12} {h2:>10} {full:>11}")
+    lines.append("="*80)
+    lines.append("")
     
-    for r in reviews:
-        lm = get_count(r, 'last_month')
-        l3m = get_count(r, 'last_3_months')
-        h2 = get_count(r, 'h2_2025')
-        full = get_count(r, 'full_2025')
-        print(f"{r['display_name']:<22} {lm:>12} {l3m:>12} {h2:>10} {full:>11}")
-        totals['last_month'] += lm
-        totals['last_3_months'] += l3m
-        totals['h2_2025'] += h2
-        totals['full_2025'] += full
-    
-    print("-"*80)
-    print(f"{'TOTAL':<22} {totals['last_month']:>12} {totals['last_3_months']:>12} "
-          f"{totals['h2_2025']:>10} {totals['full_2025']:>11}")
-    print("="*80 + "\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
     parser = argparse.ArgumentParser(description="Visualize code review statistics")
     parser.add_argument("--fetch", action="store_true", help="Fetch fresh data first")
-    parser.add_argument("--period", choices=["last_month", "last_3_months", "h2_2025", "full_2025"],
+    parser.add_argument("--period", choices=PERIODS,
                         default="full_2025", help="Period to display")
     parser.add_argument("--start", help="Custom start date (YYYY-MM-DD)")
     parser.add_argument("--end", help="Custom end date (YYYY-MM-DD)")
@@ -398,9 +608,14 @@ def main():
     parser.add_argument("--no-show", action="store_true", help="Don't show plots (for export only)")
     parser.add_argument("--chart", choices=["bar", "pie", "comparison", "all"], default="all",
                         help="Chart type to display")
+    parser.add_argument("--combined", action="store_true",
+                        help="With --chart all --export, save one all_<period> figure instead of one file per chart")
     
     args = parser.parse_args()
     
+    # Fail on a missing team config before doing any other work
+    _config()
+    
     # Fetch fresh data if requested
     if args.fetch:
         if not fetch_fresh_data():
@@ -412,8 +627,16 @@ def main():
         print("💡 Tip: Run with --fetch to get fresh data")
         sys.exit(1)
     
+    # Per-period counts are shared by the table and every chart
+    matrix = _build_matrix(data.get("reviews", []))
+    
     # Print summary table
-    print_summary_table(data)
+    print_summary_table(data, matrix)
+    
+    # Charts would be neither shown nor saved; don't build them at all
+    should_render = args.export or not args.no_show
+    if not should_render:
+        return
     
     # Determine output path
     output_dir = DATA_DIR / "charts"
@@ -421,18 +644,30 @@ def main():
     
     suffix = f".{args.export}" if args.export else None
     
-    # Generate charts
+    # Combined export: draw all three charts into one figure and save it once
+    if args.combined and args.chart == "all" and suffix:
+        fig, axes = plt.subplots(1, 3, figsize=(30, 8))
+        plot_bar_chart(data, args.period, None, matrix, axes[0])
+        plot_pie_chart(data, args.period, None, matrix, axes[1])
+        plot_comparison(data, None, matrix, axes[2])
+        _finish_figure(fig, str(output_dir / f"all_{args.period}{suffix}"))
+        print(f"\n✅ Charts exported to: {output_dir}/")
+        return
+    
+    # Generate charts one after another. Exports stay serial on purpose: a
+    # process pool would re-import matplotlib and pickle the data for each
+    # chart, which costs more than the three short renders it would split.
     if args.chart in ["bar", "all"]:
         save_path = str(output_dir / f"bar_{args.period}{suffix}") if suffix else None
-        plot_bar_chart(data, args.period, save_path)
+        plot_bar_chart(data, args.period, save_path, matrix)
     
     if args.chart in ["pie", "all"]:
         save_path = str(output_dir / f"pie_{args.period}{suffix}") if suffix else None
-        plot_pie_chart(data, args.period, save_path)
+        plot_pie_chart(data, args.period, save_path, matrix)
     
     if args.chart in ["comparison", "all"]:
         save_path = str(output_dir / f"comparison{suffix}") if suffix else None
-        plot_comparison(data, save_path)
+        plot_comparison(data, save_path, matrix)
     
     if args.export:
         print(f"\n✅ Charts exported to: {output_dir}/")